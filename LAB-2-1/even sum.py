@@ -1,10 +1,157 @@
+import mmap
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; file ingestion falls back to array
+    np = None
+
+
+# Supported on-disk integer types: (bytes per item, array typecode)
+_FILE_DTYPES = {
+    'int8': (1, 'b'),
+    'int16': (2, 'h'),
+    'int32': (4, 'i'),
+    'int64': (8, 'q'),
+}
+
+# Items processed per chunk when reading binary files
+_FILE_CHUNK_ITEMS = 1 << 20
+
+
+class EvenOddAccumulator:
+    """
+    Single-pass, mergeable accumulator for even/odd sums and counts.
+    
+    Consumes any iterable without materializing it. Partial accumulators
+    built over separate shards or threads can be combined with merge().
+    
+    Examples:
+        >>> acc = EvenOddAccumulator().update([1, 2, 3])
+        >>> acc.merge(EvenOddAccumulator().update(x for x in [4, 5])).result()['even_sum']
+        6
+    """
+    
+    __slots__ = ("even_sum", "odd_sum", "even_count", "odd_count")
+    
+    def __init__(self):
+        self.even_sum = 0
+        self.odd_sum = 0
+        self.even_count = 0
+        self.odd_count = 0
+    
+    def update(self, chunk):
+        """
+        Add every number of an iterable to the running totals.
+        
+        Args:
+            chunk (iterable): Numeric values
+        
+        Returns:
+            EvenOddAccumulator: self, to allow chaining
+        """
+        even_sum = self.even_sum
+        odd_sum = self.odd_sum
+        even_count = self.even_count
+        odd_count = self.odd_count
+        
+        for num in chunk:
+            if num % 2 == 0:
+                even_sum += num
+                even_count += 1
+            else:
+                odd_sum += num
+                odd_count += 1
+        
+        self.even_sum = even_sum
+        self.odd_sum = odd_sum
+        self.even_count = even_count
+        self.odd_count = odd_count
+        return self
+    
+    def update_range(self, start, end, step=1):
+        """
+        Add the integers start, start + step, ..., up to end (inclusive) in
+        constant time using arithmetic-series formulas.
+        
+        Args:
+            start (int): First value
+            end (int): Upper bound (inclusive)
+            step (int): Positive distance between values
+        
+        Returns:
+            EvenOddAccumulator: self, to allow chaining
+        """
+        # Not len(range(...)), which overflows past sys.maxsize terms
+        if start > end:
+            return self
+        count = (end - start) // step + 1
+        
+        if step % 2 == 0:
+            # Every term has the parity of the first one
+            groups = [(start, count)]
+        else:
+            # Parity alternates: terms 0, 2, 4, ... and terms 1, 3, 5, ...
+            groups = [(start, (count + 1) // 2), (start + step, count // 2)]
+        
+        group_step = step if step % 2 == 0 else 2 * step
+        for first, terms in groups:
+            total = terms * first + group_step * terms * (terms - 1) // 2
+            if first % 2 == 0:
+                self.even_sum += total
+                self.even_count += terms
+            else:
+                self.odd_sum += total
+                self.odd_count += terms
+        return self
+    
+    def merge(self, other):
+        """
+        Fold another accumulator's totals into this one.
+        
+        Args:
+            other (EvenOddAccumulator): Partial result to combine
+        
+        Returns:
+            EvenOddAccumulator: self, to allow chaining
+        """
+        self.even_sum += other.even_sum
+        self.odd_sum += other.odd_sum
+        self.even_count += other.even_count
+        self.odd_count += other.odd_count
+        return self
+    
+    @property
+    def total_count(self):
+        return self.even_count + self.odd_count
+    
+    def result(self):
+        """
+        Return the totals in the format of compute_even_odd_statistics().
+        
+        Returns:
+            dict: even_sum, odd_sum, total_sum, even_count, odd_count, total_count
+        """
+        return {
+            'even_sum': self.even_sum,
+            'odd_sum': self.odd_sum,
+            'total_sum': self.even_sum + self.odd_sum,
+            'even_count': self.even_count,
+            'odd_count': self.odd_count,
+            'total_count': self.total_count
+        }
+
+
 def compute_even_odd_statistics(numbers):
     """
     Compute comprehensive statistics for even and odd numbers in a collection.
     
-    This function efficiently calculates sums and counts for even and odd numbers
-    using Python generator expressions, which minimizes memory overhead and 
-    provides optimal performance for large datasets.
+    This function calculates sums and counts for even and odd numbers in a
+    single streaming pass with EvenOddAccumulator, so generators and other
+    one-shot iterables are never copied into a list.
     
     Args:
         numbers (list, tuple, or iterable): Collection of numeric values to analyze.
@@ -35,30 +182,126 @@ def compute_even_odd_statistics(numbers):
         raise TypeError("Input cannot be None")
     
     try:
-        # Convert to list to allow multiple iterations
-        numbers_list = list(numbers)
+        iterator = iter(numbers)
     except TypeError:
         raise TypeError("Input must be an iterable collection of numbers")
     
-    if not numbers_list:
+    # Single pass over the input
+    accumulator = EvenOddAccumulator().update(iterator)
+    
+    if accumulator.total_count == 0:
+        raise ValueError("Input collection cannot be empty")
+    
+    return accumulator.result()
+
+
+def _exact_sum(values):
+    """
+    Sum a NumPy int64 array exactly, without int64 overflow.
+    
+    Each value is split into a signed high half and an unsigned low half of
+    32 bits; neither partial sum can overflow for fewer than 2**31 items.
+    """
+    values = values.astype(np.int64, copy=False)
+    high = int((values >> 32).sum())
+    low = int((values & 0xFFFFFFFF).astype(np.uint64).sum())
+    return (high << 32) + low
+
+
+def _file_chunk_statistics(path, dtype, byteorder, first_item, item_count):
+    """
+    Compute even/odd statistics for one chunk of a flat binary integer file.
+    
+    Args:
+        path (str): File to read
+        dtype (str): Key of _FILE_DTYPES
+        byteorder (str): 'little' or 'big'
+        first_item (int): Index of the first item of the chunk
+        item_count (int): Number of items in the chunk
+    
+    Returns:
+        EvenOddAccumulator: Totals for the chunk
+    """
+    itemsize, typecode = _FILE_DTYPES[dtype]
+    accumulator = EvenOddAccumulator()
+    
+    if np is not None:
+        order = '<' if byteorder == 'little' else '>'
+        values = np.memmap(path, dtype=f'{order}i{itemsize}', mode='r',
+                           offset=first_item * itemsize, shape=(item_count,))
+        odd_mask = (values & 1).astype(bool)
+        odd_values = values[odd_mask]
+        total = _exact_sum(values)
+        accumulator.odd_sum = _exact_sum(odd_values)
+        accumulator.odd_count = len(odd_values)
+        accumulator.even_sum = total - accumulator.odd_sum
+        accumulator.even_count = item_count - accumulator.odd_count
+        return accumulator
+    
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = first_item * itemsize
+        values = array(typecode)
+        values.frombytes(mapped[start:start + item_count * itemsize])
+        if byteorder != sys.byteorder:
+            values.byteswap()
+        accumulator.update(values)
+    return accumulator
+
+
+def compute_even_odd_statistics_from_file(path, dtype='int64', byteorder='little',
+                                          workers=1, chunk_items=_FILE_CHUNK_ITEMS):
+    """
+    Compute even/odd statistics for a flat binary file of integers.
+    
+    The file is memory-mapped and processed in chunks of whole items, using
+    vectorized NumPy parity masks when NumPy is available (and array.array
+    otherwise), so values never become Python ints one by one. Chunks can
+    be spread over several processes.
+    
+    Args:
+        path (str): File of packed integers with no header
+        dtype (str): 'int8', 'int16', 'int32' or 'int64'
+        byteorder (str): 'little', 'big' or 'native'
+        workers (int): Number of processes to use
+        chunk_items (int): Items per chunk
+    
+    Returns:
+        dict: Statistics dictionary in the format of compute_even_odd_statistics()
+    
+    Raises:
+        ValueError: If the dtype or byte order is unknown, the file size is
+                    not a multiple of the item size, or the file is empty
+    """
+    if dtype not in _FILE_DTYPES:
+        raise ValueError(f"dtype must be one of {', '.join(_FILE_DTYPES)}")
+    
+    if byteorder == 'native':
+        byteorder = sys.byteorder
+    if byteorder not in ('little', 'big'):
+        raise ValueError("byteorder must be 'little', 'big' or 'native'")
+    
+    itemsize = _FILE_DTYPES[dtype][0]
+    size = os.path.getsize(path)
+    if size % itemsize:
+        raise ValueError(f"File size {size} is not a multiple of the {dtype} item size")
+    
+    item_total = size // itemsize
+    if item_total == 0:
         raise ValueError("Input collection cannot be empty")
     
-    # Calculate sums using generator expressions for memory efficiency
-    even_sum = sum(num for num in numbers_list if num % 2 == 0)
-    odd_sum = sum(num for num in numbers_list if num % 2 != 0)
+    chunks = [(path, dtype, byteorder, first, min(chunk_items, item_total - first))
+              for first in range(0, item_total, chunk_items)]
     
-    # Calculate counts using generator expressions
-    even_count = sum(1 for num in numbers_list if num % 2 == 0)
-    odd_count = sum(1 for num in numbers_list if num % 2 != 0)
+    accumulator = EvenOddAccumulator()
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_file_chunk_statistics, *zip(*chunks)):
+                accumulator.merge(partial)
+    else:
+        for chunk in chunks:
+            accumulator.merge(_file_chunk_statistics(*chunk))
     
-    return {
-        'even_sum': even_sum,
-        'odd_sum': odd_sum,
-        'total_sum': even_sum + odd_sum,
-        'even_count': even_count,
-        'odd_count': odd_count,
-        'total_count': len(numbers_list)
-    }
+    return accumulator.result()
 
 
 def display_statistics_report(numbers):
@@ -95,39 +338,92 @@ def display_statistics_report(numbers):
     return result
 
 
-def compute_statistics_for_range(start, end):
+def compute_statistics_for_range(start, end, step=1):
     """
     Compute even and odd statistics for a numeric range.
     
-    This is a convenience function that generates a range of consecutive integers
-    and computes statistics on them.
+    The sums and counts come from arithmetic-series formulas, so the cost is
+    constant no matter how many integers the range spans.
     
     Args:
         start (int): Starting value of the range (inclusive)
         end (int): Ending value of the range (inclusive)
+        step (int): Positive distance between consecutive values
     
     Returns:
-        dict: Statistics dictionary from compute_even_odd_statistics()
+        dict: Statistics dictionary in the format of compute_even_odd_statistics()
     
     Raises:
-        TypeError: If start or end are not integers
-        ValueError: If start > end
+        TypeError: If start, end or step are not integers
+        ValueError: If start > end or step < 1
     
     Examples:
         >>> stats = compute_statistics_for_range(1, 10)
         >>> stats['even_sum']
         30
+        >>> compute_statistics_for_range(1, 10, 3)['odd_sum']
+        8
     """
     # Input validation
     if not isinstance(start, int) or not isinstance(end, int):
         raise TypeError("Both start and end must be integers")
     
+    if not isinstance(step, int):
+        raise TypeError("step must be an integer")
+    
     if start > end:
         raise ValueError("start must be less than or equal to end")
     
-    # Generate range and compute statistics
-    numbers = list(range(start, end + 1))
-    return compute_even_odd_statistics(numbers)
+    if step < 1:
+        raise ValueError("step must be a positive integer")
+    
+    return EvenOddAccumulator().update_range(start, end, step).result()
+
+
+def compute_statistics_for_ranges(ranges):
+    """
+    Compute even and odd statistics for the union of many integer ranges.
+    
+    Overlapping or adjacent ranges are merged first, so every integer is
+    counted once; each merged range is then handled in constant time.
+    
+    Args:
+        ranges (iterable): (start, end) pairs, both inclusive
+    
+    Returns:
+        dict: Statistics dictionary in the format of compute_even_odd_statistics()
+    
+    Raises:
+        TypeError: If a bound is not an integer
+        ValueError: If no ranges are given or a range has start > end
+    
+    Examples:
+        >>> compute_statistics_for_ranges([(1, 5), (4, 10)])['total_count']
+        10
+    """
+    intervals = []
+    for start, end in ranges:
+        if not isinstance(start, int) or not isinstance(end, int):
+            raise TypeError("Both start and end must be integers")
+        if start > end:
+            raise ValueError("start must be less than or equal to end")
+        intervals.append((start, end))
+    
+    if not intervals:
+        raise ValueError("Input collection cannot be empty")
+    
+    intervals.sort()
+    accumulator = EvenOddAccumulator()
+    current_start, current_end = intervals[0]
+    for start, end in intervals[1:]:
+        if start <= current_end + 1:
+            current_end = max(current_end, end)
+        else:
+            accumulator.update_range(current_start, current_end)
+            current_start, current_end = start, end
+    accumulator.update_range(current_start, current_end)
+    
+    return accumulator.result()
 
 
 # Main execution block - demonstrates module functionality
@@ -166,6 +462,29 @@ if __name__ == "__main__":
     print(f"Total Sum: {result_example_3['total_sum']:>9} (Total: {result_example_3['total_count']} numbers)")
     print("-" * 50)
     
+    # Example 3b: Huge range, stepped range and union of ranges
+    print("[Example 3b] Closed-Form Ranges")
+    huge = compute_statistics_for_range(1, 10 ** 12)
+    print(f"1 to 10^12: Even Sum = {huge['even_sum']}, Odd Sum = {huge['odd_sum']}")
+    stepped = compute_statistics_for_range(1, 100, 7)
+    print(f"1 to 100 step 7: {stepped}")
+    union = compute_statistics_for_ranges([(1, 50), (40, 100), (1000, 2000)])
+    print(f"Union of [1, 50], [40, 100], [1000, 2000]: {union}")
+    print("-" * 50)
+    
+    # Example 3c: Binary file ingestion
+    print("[Example 3c] Binary int64 File")
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = os.path.join(tmp_dir, "numbers.bin")
+        with open(data_path, "wb") as data_file:
+            array('q', range(1, 1000001)).tofile(data_file)
+        file_stats = compute_even_odd_statistics_from_file(data_path, dtype='int64',
+                                                           byteorder='native')
+        print(f"1 to 1,000,000 from file: {file_stats}")
+    print("-" * 50)
+    
     # Example 4: List containing negative numbers
     print("\n[Example 4] List with Negative Numbers")
     numbers_example_4 = [-5, -4, -3, -2, -1, 0, 1, 2, 3, 4, 5]
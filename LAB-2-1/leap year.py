@@ -1,34 +1,37 @@
-def is_leap_year(year):
-    """
-    Check if a year is a leap year.
-    A leap year is:
-    - Divisible by 4 AND
-    - Either not divisible by 100 OR divisible by 400
-    
-    Args:
-        year: Integer representing the year
-    
-    Returns:
-        Boolean: True if leap year, False otherwise
-    """
-    if year % 400 == 0:
-        return True
-    elif year % 100 == 0:
-        return False
-    elif year % 4 == 0:
-        return True
-    else:
-        return False
+import os
+import sys
+
+# The shared streaming helpers live in LAB3 and the calendar helpers in
+# LAB1; they are on sys.path only while these imports run, so importing this
+# module leaves the search path unchanged
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SHARED = [os.path.join(_HERE, os.pardir, "LAB3"), os.path.join(_HERE, os.pardir, "LAB1")]
+sys.path[:0] = _SHARED
+try:
+    from bulk_stream import INVALID_CODE, stream_main
+    from leap_year import count_leap_years, is_leap_year, iter_leap_years
+finally:
+    for _path in _SHARED:
+        sys.path.remove(_path)
 
 
 def leap_years_in_range(start_year, end_year):
     """Find all leap years in a given range."""
-    leap_years = [year for year in range(start_year, end_year + 1) if is_leap_year(year)]
-    return leap_years
+    return list(iter_leap_years(start_year, end_year))
+
+
+def leap_year_codes(years):
+    """Batch classifier for the streaming mode: 1 = leap year, 0 = not."""
+    return bytes([INVALID_CODE if year is None else is_leap_year(year) for year in years])
 
 
 # Example usage
 if __name__ == "__main__":
+    # Non-interactive bulk mode: python "leap year.py" --stream [--input FILE]
+    if "--stream" in sys.argv[1:]:
+        sys.exit(stream_main(sys.argv[1:], leap_year_codes, ("Not a Leap Year", "Leap Year"),
+                             "Check a stream of years for leap years."))
+    
     print("=" * 50)
     print("Leap Year Checker")
     print("=" * 50)
@@ -52,7 +55,7 @@ if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("Leap years in 21st century (2000-2099):")
     leap_21st = leap_years_in_range(2000, 2099)
-    print(f"Total: {len(leap_21st)} leap years")
+    print(f"Total: {count_leap_years(2000, 2099)} leap years")
     print(f"First 10: {leap_21st[:10]}")
     print(f"Last 10: {leap_21st[-10:]}")
     
@@ -1,10 +1,21 @@
+import os
+import sys
+
+# The shared calendar helpers live in LAB1; it is on sys.path only while
+# this import runs, so importing this module leaves the search path unchanged
+_LAB1 = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "LAB1")
+sys.path.insert(0, _LAB1)
+try:
+    import leap_year
+finally:
+    sys.path.remove(_LAB1)
+
+
 def is_leap_year(year):
     """
     Determine whether a given year is a leap year.
     
-    A leap year is:
-    - Divisible by 400, OR
-    - Divisible by 4 AND NOT divisible by 100
+    Formats the result of the shared leap_year.is_leap_year predicate.
     
     Args:
         year (int): The year to check
@@ -12,7 +23,7 @@ def is_leap_year(year):
     Returns:
         str: A message indicating if the year is a leap year or not
     """
-    if (year % 400 == 0) or (year % 4 == 0 and year % 100 != 0):
+    if leap_year.is_leap_year(year):
         return f"{year} is a leap year"
     else:
         return f"{year} is not a leap year"
@@ -1,17 +1,54 @@
-def count_lines(filename):
+# Bytes read per chunk by count_lines_fast
+CHUNK_SIZE = 1 << 20
+
+
+def _count_newlines(file, universal_newlines, chunk_size):
     """
-    Count the number of lines in a text file.
+    Count the lines of a binary file object, one chunk at a time.
+    
+    A last line without a trailing newline still counts. In universal
+    newline mode '\r\n' and a lone '\r' also end a line; a '\r\n' pair
+    split across two chunks is counted once.
+    """
+    line_count = 0
+    last_byte = b""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        
+        line_count += chunk.count(b"\n")
+        if universal_newlines:
+            line_count += chunk.count(b"\r") - chunk.count(b"\r\n")
+            if last_byte == b"\r" and chunk[:1] == b"\n":
+                line_count -= 1
+        last_byte = chunk[-1:]
+    
+    terminators = (b"\n", b"\r") if universal_newlines else (b"\n",)
+    if last_byte and last_byte not in terminators:
+        line_count += 1
+    return line_count
+
+
+def count_lines_fast(filename, universal_newlines=False, chunk_size=CHUNK_SIZE):
+    """
+    Count the lines of a file of any size in constant memory.
+    
+    Reads the file in large binary chunks and counts newline bytes with
+    bytes.count, so no text is decoded and no line objects are created.
     
     Args:
-        filename (str): The path to the text file
+        filename (str): The path to the file
+        universal_newlines (bool): Also treat '\r\n' and '\r' as line
+                                   endings (as text mode does)
+        chunk_size (int): Bytes read per chunk
         
     Returns:
         int: The number of lines in the file, or -1 if file not found
     """
     try:
-        with open(filename, 'r') as file:
-            line_count = sum(1 for line in file)
-        return line_count
+        with open(filename, 'rb') as file:
+            return _count_newlines(file, universal_newlines, chunk_size)
     except FileNotFoundError:
         print(f"Error: File '{filename}' not found.")
         return -1
@@ -20,6 +57,22 @@ def count_lines(filename):
         return -1
 
 
+def count_lines(filename):
+    """
+    Count the number of lines in a text file.
+    
+    Uses count_lines_fast in universal newline mode, which gives the same
+    count as iterating over the file in text mode.
+    
+    Args:
+        filename (str): The path to the text file
+        
+    Returns:
+        int: The number of lines in the file, or -1 if file not found
+    """
+    return count_lines_fast(filename, universal_newlines=True)
+
+
 # Alternative version using readlines()
 def count_lines_v2(filename):
     """Count lines using readlines() method."""
@@ -0,0 +1,182 @@
+import numpy as np
+
+from leap_year import is_leap_year, is_leap_year_array
+
+
+# Days before the start of each month, row 0 for common years and row 1 for
+# leap years; column 13 holds the length of the year
+CUMULATIVE_DAYS = np.array([
+    [0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334, 365],
+    [0, 0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335, 366],
+], dtype=np.int64)
+
+# Days in each month (index 0 is unused and holds 0)
+DAYS_IN_MONTH = np.diff(CUMULATIVE_DAYS[:, 1:], axis=1, prepend=0)
+
+# Month and day of month for every 0-based day of the year, per row as above
+_MONTH_OF_DAY = np.zeros((2, 366), dtype=np.int64)
+_DAY_OF_MONTH = np.zeros((2, 366), dtype=np.int64)
+for _leap in range(2):
+    for _month in range(1, 13):
+        _first, _end = CUMULATIVE_DAYS[_leap, _month], CUMULATIVE_DAYS[_leap, _month + 1]
+        _MONTH_OF_DAY[_leap, _first:_end] = _month
+        _DAY_OF_MONTH[_leap, _first:_end] = np.arange(1, _end - _first + 1)
+
+# Days in a full 400-year Gregorian cycle
+_DAYS_PER_400_YEARS = 146097
+
+UNIX_EPOCH = (1970, 1, 1)
+
+
+def _days_before_year(years):
+    """Days from 0001-01-01 to January 1st of each year (proleptic Gregorian)."""
+    previous = years - 1
+    return previous * 365 + previous // 4 - previous // 100 + previous // 400
+
+
+def _epoch_offset(epoch):
+    """Days from 0001-01-01 to the epoch date."""
+    year, month, day = epoch
+    return int(_days_before_year(year) + CUMULATIVE_DAYS[int(is_leap_year(year)), month] + day - 1)
+
+
+def validate_dates(years, months, days):
+    """
+    Check column arrays of (year, month, day) for impossible dates.
+    
+    Args:
+        years (array-like): Integer years
+        months (array-like): Integer months (1-12)
+        days (array-like): Integer days of the month
+    
+    Returns:
+        numpy.ndarray: Boolean mask, True where the date exists
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    
+    month_ok = (months >= 1) & (months <= 12)
+    leap = is_leap_year_array(years).astype(np.int64)
+    month_length = DAYS_IN_MONTH[leap, np.where(month_ok, months, 0)]
+    return month_ok & (days >= 1) & (days <= month_length)
+
+
+def day_of_year(years, months, days):
+    """
+    Convert column arrays of dates to 1-based days of the year.
+    
+    Args:
+        years (array-like): Integer years
+        months (array-like): Integer months (1-12)
+        days (array-like): Integer days of the month
+    
+    Returns:
+        tuple: (day_of_year, valid); day_of_year is 0 where valid is False
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    
+    valid = validate_dates(years, months, days)
+    leap = is_leap_year_array(years).astype(np.int64)
+    before = CUMULATIVE_DAYS[leap, np.where(valid, months, 0)]
+    return np.where(valid, before + days, 0), valid
+
+
+def dates_to_ordinals(years, months, days, epoch=UNIX_EPOCH):
+    """
+    Convert column arrays of dates to days since an epoch.
+    
+    Args:
+        years (array-like): Integer years
+        months (array-like): Integer months (1-12)
+        days (array-like): Integer days of the month
+        epoch (tuple): (year, month, day) that maps to 0
+    
+    Returns:
+        tuple: (ordinals, valid); ordinals is 0 where valid is False
+    """
+    years = np.asarray(years, dtype=np.int64)
+    doy, valid = day_of_year(years, months, days)
+    ordinals = _days_before_year(years) + doy - 1 - _epoch_offset(epoch)
+    return np.where(valid, ordinals, 0), valid
+
+
+def ordinals_to_dates(ordinals, epoch=UNIX_EPOCH):
+    """
+    Convert days since an epoch back to column arrays of dates.
+    
+    The year is estimated from the 400-year cycle length and corrected by
+    at most one step; month and day then come from table lookups.
+    
+    Args:
+        ordinals (array-like): Integer days since epoch
+        epoch (tuple): (year, month, day) that maps to 0
+    
+    Returns:
+        tuple: (years, months, days) as int64 arrays
+    """
+    # 0-based days since 0001-01-01
+    serial = np.asarray(ordinals, dtype=np.int64) + _epoch_offset(epoch)
+    
+    years = serial * 400 // _DAYS_PER_400_YEARS + 1
+    years -= _days_before_year(years) > serial
+    years += _days_before_year(years + 1) <= serial
+    
+    month_day, _ = dates_from_day_of_year(years, serial - _days_before_year(years) + 1)
+    return (years,) + month_day
+
+
+def dates_from_day_of_year(years, day_numbers):
+    """
+    Convert 1-based days of the year back to months and days.
+    
+    Args:
+        years (array-like): Integer years
+        day_numbers (array-like): Days of the year (1-365, or 1-366 in leap
+                                  years)
+    
+    Returns:
+        tuple: ((months, days), valid); months and days are 0 where valid
+               is False
+    """
+    years = np.asarray(years, dtype=np.int64)
+    day_numbers = np.asarray(day_numbers, dtype=np.int64)
+    
+    leap = is_leap_year_array(years).astype(np.int64)
+    valid = (day_numbers >= 1) & (day_numbers <= CUMULATIVE_DAYS[leap, 13])
+    index = np.where(valid, day_numbers - 1, 0)
+    months = np.where(valid, _MONTH_OF_DAY[leap, index], 0)
+    days = np.where(valid, _DAY_OF_MONTH[leap, index], 0)
+    return (months, days), valid
+
+
+# Demonstration
+if __name__ == "__main__":
+    import time
+    
+    print("=" * 70)
+    print("BULK DATE ENGINE")
+    print("=" * 70 + "\n")
+    
+    years = [2024, 2023, 2000, 1900, 1970, 2024]
+    months = [2, 2, 12, 2, 1, 13]
+    days = [29, 29, 31, 29, 1, 1]
+    
+    doy, valid = day_of_year(years, months, days)
+    ordinals, _ = dates_to_ordinals(years, months, days)
+    for row in zip(years, months, days, valid, doy, ordinals):
+        year, month, day, ok, number, ordinal = row
+        status = f"day {number:>3}, {ordinal:>6} days since 1970-01-01" if ok else "invalid"
+        print(f"{year}-{month:02d}-{day:02d}: {status}")
+    
+    count = 10_000_000
+    rng = np.random.default_rng(0)
+    ordinals = rng.integers(-200_000, 200_000, count)
+    start_time = time.perf_counter()
+    columns = ordinals_to_dates(ordinals)
+    round_trip, valid = dates_to_ordinals(*columns)
+    elapsed = time.perf_counter() - start_time
+    print(f"\nRound-tripped {count:,} dates in {elapsed:.2f}s "
+          f"(all valid: {valid.all()}, exact: {(round_trip == ordinals).all()})")
@@ -1,3 +1,9 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for is_leap_year_array
+    np = None
+
+
 def is_leap_year(year):
     """
     Check if a given year is a leap year.
@@ -28,6 +34,66 @@ def is_leap_year_concise(year):
     return (year % 400 == 0) or (year % 4 == 0 and year % 100 != 0)
 
 
+def _leap_years_through(year):
+    """Number of leap years in the proleptic Gregorian calendar from 1 to year."""
+    return year // 4 - year // 100 + year // 400
+
+
+def count_leap_years(start_year, end_year):
+    """
+    Count the leap years in [start_year, end_year] in constant time.
+    
+    Uses inclusion-exclusion over the multiples of 4, 100 and 400 instead of
+    testing every year.
+    
+    Args:
+        start_year (int): First year of the range (inclusive)
+        end_year (int): Last year of the range (inclusive)
+        
+    Returns:
+        int: Number of leap years in the range (0 if it is empty)
+    """
+    if end_year < start_year:
+        return 0
+    return _leap_years_through(end_year) - _leap_years_through(start_year - 1)
+
+
+def iter_leap_years(start_year, end_year):
+    """
+    Generate the leap years in [start_year, end_year] in ascending order.
+    
+    Steps from one multiple of 4 to the next and only skips the century
+    years not divisible by 400, so about a quarter of the years are visited.
+    
+    Args:
+        start_year (int): First year of the range (inclusive)
+        end_year (int): Last year of the range (inclusive)
+        
+    Yields:
+        int: Each leap year in the range
+    """
+    for year in range(start_year + (-start_year) % 4, end_year + 1, 4):
+        if year % 100 != 0 or year % 400 == 0:
+            yield year
+
+
+def is_leap_year_array(years):
+    """
+    Vectorized leap-year test over an array of years (requires NumPy).
+    
+    Args:
+        years (array-like): Integer years
+        
+    Returns:
+        numpy.ndarray: Boolean array, True where the year is a leap year
+    """
+    if np is None:
+        raise ImportError("is_leap_year_array requires NumPy")
+    
+    years = np.asarray(years)
+    return (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+
+
 # Test cases
 if __name__ == "__main__":
     test_years = [2000, 2004, 2100, 2024, 2023, 1900, 2400]
@@ -37,3 +103,7 @@ if __name__ == "__main__":
     for year in test_years:
         result = is_leap_year(year)
         print(f"{year}: {'Leap Year' if result else 'Not a Leap Year'}")
+    
+    print("-" * 40)
+    print(f"Leap years 1-2024: {count_leap_years(1, 2024)}")
+    print(f"Leap years 1890-1920: {list(iter_leap_years(1890, 1920))}")
@@ -1,3 +1,11 @@
+from digit_engine import digit_histogram
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for is_armstrong_batch
+    np = None
+
+
 def is_armstrong_number(num):
     """
     Check whether a given number is an Armstrong number.
@@ -16,12 +24,12 @@ def is_armstrong_number(num):
         str: "Armstrong Number" if it is an Armstrong number, 
              "Not an Armstrong Number" otherwise
     """
-    # Convert to string to work with individual digits
-    num_str = str(abs(num))  # Use abs to handle negative numbers
-    num_digits = len(num_str)
+    # Count each digit of abs(num); the digit engine handles huge integers
+    counts = digit_histogram(num)
+    num_digits = sum(counts)
     
     # Calculate the sum of digits raised to the power of number of digits
-    sum_of_powers = sum(int(digit) ** num_digits for digit in num_str)
+    sum_of_powers = sum(count * digit ** num_digits for digit, count in enumerate(counts) if count)
     
     # Check if the sum equals the original number
     if sum_of_powers == abs(num):
@@ -40,12 +48,73 @@ def is_armstrong_bool(num):
     Returns:
         bool: True if it is an Armstrong number, False otherwise
     """
-    num_str = str(abs(num))
-    num_digits = len(num_str)
-    sum_of_powers = sum(int(digit) ** num_digits for digit in num_str)
+    counts = digit_histogram(num)
+    num_digits = sum(counts)
+    sum_of_powers = sum(count * digit ** num_digits for digit, count in enumerate(counts) if count)
     return sum_of_powers == abs(num)
 
 
+def is_armstrong_batch(numbers):
+    """
+    Check a whole integer array for Armstrong numbers at once (requires NumPy).
+    
+    Digits are extracted arithmetically, one column at a time, for all
+    numbers with the same digit count, and looked up in a digit**k table
+    for that count. Results match is_armstrong_bool, including abs() for
+    negative numbers.
+    
+    Args:
+        numbers (array-like): Integer array, typically int64
+        
+    Returns:
+        numpy.ndarray: Boolean mask with the same shape as numbers
+        
+    Raises:
+        ImportError: If NumPy is not installed
+        TypeError: If numbers is not an integer array
+    """
+    if np is None:
+        raise ImportError("is_armstrong_batch requires NumPy")
+    
+    array = np.asarray(numbers)
+    # An empty list comes back as float64; there is nothing to check
+    if array.size == 0:
+        return np.zeros(array.shape, dtype=bool)
+    if array.dtype.kind not in "iu":
+        raise TypeError("numbers must be an integer array")
+    
+    # Work in uint64 so abs() of the most negative int64 is still exact
+    if array.dtype.kind == "i":
+        values = np.abs(array.astype(np.int64, copy=False)).astype(np.uint64).ravel()
+    else:
+        values = array.astype(np.uint64, copy=False).ravel()
+    
+    num_digits = np.ones(values.shape, dtype=np.int64)
+    for power in range(1, 20):
+        num_digits += values >= np.uint64(10 ** power)
+    
+    mask = np.zeros(values.shape, dtype=bool)
+    for length in np.unique(num_digits):
+        length = int(length)
+        indices = np.nonzero(num_digits == length)[0]
+        bucket = values[indices]
+        table = np.array([digit ** length for digit in range(10)], dtype=np.uint64)
+        
+        remaining = bucket.copy()
+        total = np.zeros(bucket.shape, dtype=np.uint64)
+        # Float shadow sum flags 19-20 digit sums that wrapped around 2**64
+        approx = np.zeros(bucket.shape, dtype=np.float64)
+        for _ in range(length):
+            powers = table[remaining % np.uint64(10)]
+            total += powers
+            approx += powers
+            remaining //= np.uint64(10)
+        
+        mask[indices] = (total == bucket) & (approx < 2.0 ** 64)
+    
+    return mask.reshape(array.shape)
+
+
 # Test cases
 if __name__ == "__main__":
     test_cases = [153, 370, 371, 407, 123, 100, 9, 10, 1, 0]
@@ -69,3 +138,11 @@ if __name__ == "__main__":
     print(f"Input: 153 -> Output: {is_armstrong_number(153)}")
     print(f"Input: 370 -> Output: {is_armstrong_number(370)}")
     print(f"Input: 123 -> Output: {is_armstrong_number(123)}")
+    
+    # Batch check over an integer array
+    if np is not None:
+        print("\n" + "=" * 80)
+        print("Batch Check (NumPy):\n")
+        batch = np.array([153, -370, 371, 407, 123, 9474, 4679307774, 4498128791164624869])
+        print(f"Input: {batch.tolist()}")
+        print(f"Mask:  {is_armstrong_batch(batch).tolist()}")
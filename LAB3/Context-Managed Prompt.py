@@ -1,4 +1,52 @@
 import math
+import mmap
+import os
+import struct
+import zlib
+from array import array
+
+from bitpack import pack_bits
+
+
+# Number of odd candidates sieved per segment. Primality flags take one byte
+# each (32 KiB per segment, L1-sized); smallest-factor segments take four
+# bytes each (128 KiB, L2-sized) while the base primes fit in 32 bits.
+_SEGMENT_SIZE = 1 << 15
+
+# On-disk prime bitmap: header, then one bit per odd number below the bound
+_INDEX_MAGIC = b"PRIMEIDX"
+_INDEX_VERSION = 1
+_INDEX_HEADER = struct.Struct("<8sIQI")  # magic, version, bound, CRC-32 of bitmap
+
+# Index installed by load_prime_index; is_prime and classify_number use it
+_prime_index = None
+
+
+def format_classification(num, classification, divisor=None):
+    """
+    Build the message used by classify_number for a classified number.
+    
+    Args:
+        num (int): The classified number
+        classification (str): "Prime", "Composite" or "Neither"
+        divisor (int, optional): Smallest divisor, for composites
+        
+    Returns:
+        str: Classification message with details
+    """
+    if classification == "Prime":
+        return f"{num} is Prime"
+    
+    if classification == "Composite":
+        return f"{num} is Composite (divisible by {divisor})"
+    
+    if num < 0:
+        return f"{num} is Neither (negative numbers are not classified as Prime or Composite)"
+    
+    if num == 0:
+        return "0 is Neither (0 is not classified as Prime or Composite)"
+    
+    return "1 is Neither (1 is not considered Prime or Composite)"
 
 
 def classify_number(num):
@@ -23,33 +71,28 @@ def classify_number(num):
     except (ValueError, TypeError):
         return "Invalid Input: Please provide a valid integer"
     
-    # Handle negative numbers
-    if num < 0:
-        return f"{num} is Neither (negative numbers are not classified as Prime or Composite)"
-    
-    # Handle special cases: 0 and 1
-    if num == 0:
-        return "0 is Neither (0 is not classified as Prime or Composite)"
-    
-    if num == 1:
-        return "1 is Neither (1 is not considered Prime or Composite)"
+    # Handle negative numbers, 0 and 1
+    if num < 2:
+        return format_classification(num, "Neither")
     
     # Handle 2 (the only even prime)
     if num == 2:
-        return f"{num} is Prime"
+        return format_classification(num, "Prime")
+    
+    # Single bit test when a prime index covers this number
+    if _prime_index is not None and num < _prime_index.bound and _prime_index.is_prime(num):
+        return format_classification(num, "Prime")
     
     # Even numbers greater than 2 are composite
     if num % 2 == 0:
-        return f"{num} is Composite (divisible by 2)"
+        return format_classification(num, "Composite", 2)
     
-    # Check for odd divisors up to sqrt(num)
-    sqrt_num = int(math.sqrt(num))
-    for i in range(3, sqrt_num + 1, 2):
-        if num % i == 0:
-            return f"{num} is Composite (divisible by {i})"
+    # Small-prime trial division, then Miller-Rabin and Pollard-rho
+    divisor = smallest_prime_factor(num)
+    if divisor == num:
+        return format_classification(num, "Prime")
     
-    # If no divisors found, it's prime
-    return f"{num} is Prime"
+    return format_classification(num, "Composite", divisor)
 
 
 def is_prime(num):
@@ -65,17 +108,574 @@ def is_prime(num):
     if not isinstance(num, int) or num < 2:
         return False
     
+    if _prime_index is not None and num < _prime_index.bound:
+        return _prime_index.is_prime(num)
+    
     if num == 2:
         return True
     
     if num % 2 == 0:
         return False
     
-    sqrt_num = int(math.sqrt(num))
-    for i in range(3, sqrt_num + 1, 2):
-        if num % i == 0:
+    for p in _SMALL_PRIMES:
+        if num % p == 0:
+            return num == p
+    
+    # No factor up to the trial bound, so anything below its square is prime
+    if num < _TRIAL_LIMIT * _TRIAL_LIMIT:
+        return True
+    
+    return _is_probable_prime(num)
+
+
+def _base_primes(limit):
+    """
+    Return all primes up to limit (inclusive) with an odd-only sieve.
+    
+    Args:
+        limit (int): Upper bound of the primes to return
+        
+    Returns:
+        list: Primes in ascending order
+    """
+    if limit < 2:
+        return []
+    
+    # Index i stands for the odd number 2*i + 3
+    size = (limit - 1) // 2
+    flags = bytearray([1]) * size
+    for i in range((math.isqrt(limit) - 1) // 2):
+        if flags[i]:
+            p = 2 * i + 3
+            start = (p * p - 3) // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    
+    return [2] + [2 * i + 3 for i in range(size) if flags[i]]
+
+
+def _segment_offsets(first, count, primes):
+    """
+    Find where each odd base prime starts marking a segment of odd numbers.
+    
+    Args:
+        first (int): Odd number at index 0 of the segment
+        count (int): Number of odd candidates in the segment
+        primes (list): All primes up to the square root of the segment end
+        
+    Yields:
+        tuple: (p, index) for every odd prime p that has an odd multiple
+               other than p itself at first + 2*index, in ascending order
+    """
+    last = first + 2 * (count - 1)
+    for p in primes[1:]:
+        square = p * p
+        if square > last:
+            break
+        # First odd multiple of p inside the segment, never p itself
+        start = max(square, -(-first // p) * p)
+        if start % 2 == 0:
+            start += p
+        index = (start - first) // 2
+        if index < count:
+            yield p, index
+
+
+def _segments(lo, hi, segment_size):
+    """Yield (first, count) for each segment of odd numbers in [lo, hi)."""
+    first = lo | 1
+    while first < hi:
+        count = min(segment_size, (hi - first + 1) // 2)
+        yield first, count
+        first += 2 * count
+
+
+def _sieve_segments(lo, hi, primes, segment_size=_SEGMENT_SIZE):
+    """
+    Run a segmented Sieve of Eratosthenes over the odd numbers in [lo, hi).
+    
+    Only odd numbers are stored, one byte per candidate, and at most
+    segment_size candidates are held in memory at a time.
+    
+    Args:
+        lo (int): Lower bound (inclusive), must be at least 3
+        hi (int): Upper bound (exclusive)
+        primes (list): All primes up to isqrt(hi - 1)
+        segment_size (int): Number of odd candidates per segment
+        
+    Yields:
+        tuple: (first, flags) where flags[i] is 1 if first + 2*i is prime
+    """
+    for first, count in _segments(lo, hi, segment_size):
+        flags = bytearray([1]) * count
+        for p, index in _segment_offsets(first, count, primes):
+            flags[index::p] = bytes(len(range(index, count, p)))
+        yield first, flags
+
+
+def _factor_segments(lo, hi, primes, segment_size=_SEGMENT_SIZE):
+    """
+    Segmented sieve over the odd numbers in [lo, hi) that records the
+    smallest prime factor of every composite.
+    
+    Base primes are written in descending order, so each slot ends up
+    holding the smallest prime that marked it; the marking stays in C
+    slice assignments instead of a per-number Python loop.
+    
+    Args:
+        lo (int): Lower bound (inclusive), must be at least 3
+        hi (int): Upper bound (exclusive)
+        primes (list): All primes up to isqrt(hi - 1)
+        segment_size (int): Number of odd candidates per segment
+        
+    Yields:
+        tuple: (first, factors) where factors[i] is the smallest prime
+               factor of first + 2*i, or 0 if that number is prime
+    """
+    # Smallest factors are at most isqrt(hi - 1); use the narrowest type
+    # that holds them to keep segments cache-sized
+    typecode = "I" if not primes or primes[-1] < 1 << (8 * array("I").itemsize) else "Q"
+    
+    for first, count in _segments(lo, hi, segment_size):
+        factors = array(typecode, bytes(array(typecode).itemsize * count))
+        for p, index in reversed(list(_segment_offsets(first, count, primes))):
+            if index + p >= count:
+                factors[index] = p
+            else:
+                factors[index::p] = array(typecode, [p]) * len(range(index, count, p))
+        yield first, factors
+
+
+# Trial division bound used before switching to Miller-Rabin
+_TRIAL_LIMIT = 1000
+_SMALL_PRIMES = _base_primes(_TRIAL_LIMIT)
+
+# Witnesses that make Miller-Rabin deterministic for every n < 2**64
+_MR_BASES_64 = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def _is_strong_probable_prime(n, a):
+    """
+    Run one round of the Miller-Rabin test on odd n with base a.
+    
+    Args:
+        n (int): Odd number greater than a
+        a (int): Witness base
+        
+    Returns:
+        bool: True if n is a strong probable prime to base a
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    
+    return False
+
+
+def _jacobi(a, n):
+    """
+    Compute the Jacobi symbol (a/n) for odd positive n.
+    
+    Args:
+        a (int): Numerator
+        n (int): Odd positive denominator
+        
+    Returns:
+        int: -1, 0 or 1
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    
+    return result if n == 1 else 0
+
+
+def _is_strong_lucas_probable_prime(n):
+    """
+    Run the strong Lucas probable prime test with Selfridge parameters.
+    
+    Args:
+        n (int): Odd number with no small prime factors
+        
+    Returns:
+        bool: True if n is a strong Lucas probable prime
+    """
+    # Perfect squares never yield a D with Jacobi symbol -1
+    if math.isqrt(n) ** 2 == n:
+        return False
+    
+    # Selfridge method A: first D in 5, -7, 9, -11, ... with (D/n) == -1
+    D = 5
+    while True:
+        jacobi = _jacobi(D, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(D) != n:
             return False
+        D = -D - 2 if D > 0 else -D + 2
+    
+    P = 1
+    Q = (1 - D) // 4
+    
+    d = n + 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    # Binary ladder for U_d, V_d and Q^d, starting from k = 1
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U = U * V % n
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            # Halve modulo n (n is odd, so adding n makes the value even)
+            if U % 2:
+                U += n
+            if V % 2:
+                V += n
+            U = U // 2 % n
+            V = V // 2 % n
+            Qk = Qk * Q % n
+    
+    if U == 0 or V == 0:
+        return True
     
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        if V == 0:
+            return True
+        Qk = Qk * Qk % n
+    
+    return False
+
+
+def _is_probable_prime(n):
+    """
+    Test an odd number with no small prime factors for primality.
+    
+    Deterministic Miller-Rabin for n < 2**64 and Baillie-PSW above, which
+    has no known counterexample.
+    
+    Args:
+        n (int): Odd number greater than the trial division bound
+        
+    Returns:
+        bool: True if n is prime
+    """
+    if n < 1 << 64:
+        return all(_is_strong_probable_prime(n, a) for a in _MR_BASES_64)
+    
+    return _is_strong_probable_prime(n, 2) and _is_strong_lucas_probable_prime(n)
+
+
+def pollard_brent(n):
+    """
+    Find a nontrivial factor of a composite number with Brent's variant of
+    Pollard's rho algorithm.
+    
+    Args:
+        n (int): A composite number
+        
+    Returns:
+        int: A divisor d of n with 1 < d < n (not necessarily prime)
+    """
+    if n % 2 == 0:
+        return 2
+    
+    batch = 128
+    c = 1
+    while True:
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch
+            r *= 2
+        
+        # The batched gcd overshot; replay one step at a time
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        
+        if g != n:
+            return g
+        
+        # Cycle closed without a split; retry with another polynomial
+        c += 1
+
+
+def smallest_prime_factor(num):
+    """
+    Find the smallest prime factor of a number.
+    
+    Small factors are found by trial division; larger numbers are tested
+    with Miller-Rabin and split with Pollard-rho until fully factored.
+    
+    Args:
+        num (int): An integer greater than 1
+        
+    Returns:
+        int: The smallest prime factor (num itself if num is prime)
+    """
+    for p in _SMALL_PRIMES:
+        if num % p == 0:
+            return p
+    
+    if num < _TRIAL_LIMIT * _TRIAL_LIMIT or _is_probable_prime(num):
+        return num
+    
+    smallest = num
+    pending = [num]
+    while pending:
+        n = pending.pop()
+        if n < _TRIAL_LIMIT * _TRIAL_LIMIT or _is_probable_prime(n):
+            smallest = min(smallest, n)
+        else:
+            d = pollard_brent(n)
+            pending.append(d)
+            pending.append(n // d)
+    
+    return smallest
+
+
+def classify_range(start, stop, segment_size=_SEGMENT_SIZE):
+    """
+    Classify every integer in [start, stop) as Prime, Composite, or Neither.
+    
+    Uses a segmented Sieve of Eratosthenes, so a whole range is classified in
+    near-linear time while memory stays bounded by segment_size. Results
+    agree with classify_number; use format_classification to obtain the
+    same messages.
+    
+    Args:
+        start (int): First number to classify (inclusive)
+        stop (int): End of the range (exclusive)
+        segment_size (int): Number of odd candidates sieved at a time
+        
+    Yields:
+        tuple: (num, classification, divisor) where divisor is the smallest
+               divisor for composites and None otherwise
+    """
+    # Negative numbers, 0 and 1
+    for num in range(start, min(stop, 2)):
+        yield num, "Neither", None
+    
+    lo = max(start, 2)
+    if lo >= stop:
+        return
+    
+    if lo == 2:
+        yield 2, "Prime", None
+        lo = 3
+    
+    if lo % 2 == 0 and lo < stop:
+        yield lo, "Composite", 2
+        lo += 1
+    
+    primes = _base_primes(math.isqrt(stop - 1))
+    
+    for first, factors in _factor_segments(lo, stop, primes, segment_size):
+        num = first
+        for factor in factors:
+            if factor:
+                yield num, "Composite", factor
+            else:
+                yield num, "Prime", None
+            if num + 1 < stop:
+                yield num + 1, "Composite", 2
+            num += 2
+
+
+def build_prime_index(path, bound, segment_size=_SEGMENT_SIZE):
+    """
+    Write a bit-packed primality bitmap for all numbers below bound.
+    
+    The file holds a small header (magic, version, bound, CRC-32) followed
+    by one bit per odd number 1, 3, 5, ... below bound. It is written to a
+    temporary file first and moved into place, so readers never observe a
+    partially written index.
+    
+    Args:
+        path (str): Destination file
+        bound (int): Exclusive upper bound of the indexed numbers
+        segment_size (int): Number of odd candidates sieved at a time
+        
+    Returns:
+        int: Size of the written file in bytes
+    """
+    if bound < 0:
+        raise ValueError("bound must be non-negative")
+    
+    primes = _base_primes(math.isqrt(max(bound - 1, 0)))
+    checksum = 0
+    tmp_path = f"{path}.tmp"
+    
+    with open(tmp_path, "wb") as file:
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, bound, 0))
+        
+        # Bit 0 stands for 1, which is not prime; carry leftovers between
+        # segments so that every packed byte covers exactly eight odds
+        pending = bytearray(min(bound // 2, 1))
+        for _, flags in _sieve_segments(3, bound, primes, segment_size):
+            pending += flags
+            full = len(pending) - len(pending) % 8
+            chunk = pack_bits(pending[:full])
+            checksum = zlib.crc32(chunk, checksum)
+            file.write(chunk)
+            del pending[:full]
+        
+        if pending:
+            chunk = pack_bits(pending)
+            checksum = zlib.crc32(chunk, checksum)
+            file.write(chunk)
+        
+        file.seek(0)
+        file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, _INDEX_VERSION, bound, checksum))
+        size = file.seek(0, os.SEEK_END)
+    
+    os.replace(tmp_path, path)
+    return size
+
+
+class PrimeIndex:
+    """
+    Read-only, memory-mapped view of a file written by build_prime_index.
+    
+    The bitmap is never copied into the process: lookups read straight from
+    the mapping, and the operating system shares its pages between every
+    process that maps the same file.
+    
+    Args:
+        path (str): Index file to map
+        verify (bool): Check the CRC-32 of the bitmap (reads the whole file)
+        
+    Raises:
+        ValueError: If the file is not a valid prime index
+    """
+    
+    def __init__(self, path, verify=True):
+        with open(path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            if len(self._map) < _INDEX_HEADER.size:
+                raise ValueError(f"'{path}' is too small to be a prime index")
+            
+            magic, version, bound, checksum = _INDEX_HEADER.unpack_from(self._map, 0)
+            if magic != _INDEX_MAGIC:
+                raise ValueError(f"'{path}' is not a prime index")
+            if version != _INDEX_VERSION:
+                raise ValueError(f"Unsupported prime index version: {version}")
+            
+            expected = _INDEX_HEADER.size + (bound // 2 + 7) // 8
+            if len(self._map) != expected:
+                raise ValueError(f"'{path}' is truncated or corrupt")
+            
+            if verify:
+                with memoryview(self._map) as view:
+                    if zlib.crc32(view[_INDEX_HEADER.size:]) != checksum:
+                        raise ValueError(f"Checksum mismatch in '{path}'")
+        except ValueError:
+            self._map.close()
+            raise
+        
+        self.bound = bound
+    
+    def is_prime(self, num):
+        """
+        Look up whether a number below the bound is prime.
+        
+        Args:
+            num (int): Number in the range [0, bound)
+            
+        Returns:
+            bool: True if prime, False otherwise
+        """
+        if num % 2 == 0:
+            return num == 2
+        
+        index = num >> 1
+        return bool(self._map[_INDEX_HEADER.size + (index >> 3)] >> (7 - (index & 7)) & 1)
+    
+    def close(self):
+        """
+        Release the memory mapping.
+        
+        If this is the index installed by load_prime_index, it is
+        uninstalled first, so is_prime falls back to arithmetic.
+        """
+        global _prime_index
+        
+        if _prime_index is self:
+            _prime_index = None
+        self._map.close()
+
+
+def load_prime_index(path, verify=True):
+    """
+    Map a prime index and install it for is_prime and classify_number.
+    
+    Numbers at or above the index bound keep using the arithmetic path.
+    Worker processes created with fork inherit the installed index; spawned
+    workers should call this again (verify=False skips the full read).
+    
+    Args:
+        path (str): Index file written by build_prime_index
+        verify (bool): Check the CRC-32 of the bitmap
+        
+    Returns:
+        PrimeIndex: The installed index
+    """
+    global _prime_index
+    
+    index = PrimeIndex(path, verify=verify)
+    unload_prime_index()
+    _prime_index = index
+    return index
+
+
+def unload_prime_index():
+    """
+    Uninstall and close the index installed by load_prime_index, if any.
+    
+    Returns:
+        bool: True if an index was installed
+    """
+    if _prime_index is None:
+        return False
+    
+    _prime_index.close()
     return True
 
 
@@ -101,7 +701,12 @@ if __name__ == "__main__":
     print("Performance Test - Large Numbers:")
     print("=" * 70 + "\n")
     
-    large_numbers = [1000000007, 1000000008, 1000000009, 9999991]
+    large_numbers = [
+        1000000007, 1000000008, 1000000009, 9999991,
+        18446744073709551557,            # largest prime below 2**64
+        4611685975477714963,             # 2147483647 * 2147483629
+        2**89 - 1,                       # Mersenne prime (Baillie-PSW path)
+    ]
     
     for num in large_numbers:
         result = classify_number(num)
@@ -126,3 +731,32 @@ if __name__ == "__main__":
     check_numbers = [2, 17, 25, 97]
     for num in check_numbers:
         print(f"is_prime({num}): {is_prime(num)}")
+    
+    # Bulk range classification demo
+    print("\n" + "=" * 70)
+    print("Range Classification (Segmented Sieve):")
+    print("=" * 70 + "\n")
+    
+    for num, classification, divisor in classify_range(-2, 12):
+        print(format_classification(num, classification, divisor))
+    
+    primes_found = sum(1 for _, c, _ in classify_range(0, 1000000) if c == "Prime")
+    print(f"\nPrimes below 1,000,000: {primes_found}")
+    
+    # Memory-mapped prime index demo
+    print("\n" + "=" * 70)
+    print("Memory-Mapped Prime Index:")
+    print("=" * 70 + "\n")
+    
+    import tempfile
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        index_path = os.path.join(tmp_dir, "primes.idx")
+        size = build_prime_index(index_path, 10000000)
+        index = load_prime_index(index_path)
+        print(f"Indexed numbers below {index.bound:,} in {size:,} bytes")
+        
+        for num in [9999991, 9999993, 1000000007]:
+            print(f"is_prime({num}): {is_prime(num)}")
+        
+        unload_prime_index()
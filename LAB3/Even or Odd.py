@@ -1,3 +1,23 @@
+import sys
+from array import array
+from collections.abc import Mapping
+
+from bitpack import pack_bits
+from bulk_stream import INVALID_CODE, stream_main
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; classify_parity_batch falls back to bytes
+    np = None
+
+
+# struct format codes of integer buffer items
+_INTEGER_FORMATS = set("bBhHiIlLqQnN?")
+
+# Maps every byte value to its lowest bit
+_LOW_BIT = bytes(value & 1 for value in range(256))
+
+
 def check_even_or_odd(num):
     """
     Check whether a number is even or odd with validation.
@@ -26,40 +46,194 @@ def check_even_or_odd(num):
         return "Odd"
 
 
-def check_even_or_odd_verbose(num):
+def _parse_integer(num):
     """
-    Check whether a number is even or odd with detailed output.
+    Convert a value to int the way check_even_or_odd does.
     
     Args:
-        num: The value to check
+        num: The value to convert
         
     Returns:
-        dict: Dictionary with classification and details
+        int or None: The integer, or None if the value is invalid
     """
     try:
         if isinstance(num, str):
-            num = int(num.strip())
-        elif not isinstance(num, int):
-            num = int(num)
+            return int(num.strip())
+        if isinstance(num, int):
+            return num
+        return int(num)
     except (ValueError, TypeError):
-        return {
-            "valid": False,
-            "message": "Invalid Input: Please provide a valid integer",
-            "number": None,
-            "classification": None
-        }
-    
-    is_even = num % 2 == 0
-    classification = "Even" if is_even else "Odd"
-    
-    return {
-        "valid": True,
-        "number": num,
-        "classification": classification,
-        "message": f"{num} is {classification}",
-        "divisible_by_2": is_even,
-        "remainder": num % 2
-    }
+        return None
+
+
+class ParityResult(Mapping):
+    """
+    Result of check_even_or_odd_verbose.
+    
+    Only the number is stored; every other field, including the message, is
+    derived on access. It is a read-only Mapping (result["message"], get,
+    keys, values, items, ==) with the keys of the old dictionary result,
+    but not a dict: isinstance(result, dict) is False, and json.dumps or
+    code that mutates the result needs result.to_dict().
+    """
+    
+    __slots__ = ("number",)
+    
+    _VALID_KEYS = ("valid", "number", "classification", "message", "divisible_by_2", "remainder")
+    _INVALID_KEYS = ("valid", "message", "number", "classification")
+    
+    def __init__(self, number):
+        self.number = number
+    
+    @property
+    def valid(self):
+        return self.number is not None
+    
+    @property
+    def divisible_by_2(self):
+        return self.number % 2 == 0 if self.valid else None
+    
+    @property
+    def remainder(self):
+        return self.number % 2 if self.valid else None
+    
+    @property
+    def classification(self):
+        if not self.valid:
+            return None
+        return "Even" if self.number % 2 == 0 else "Odd"
+    
+    @property
+    def message(self):
+        if not self.valid:
+            return "Invalid Input: Please provide a valid integer"
+        return f"{self.number} is {self.classification}"
+    
+    def _keys(self):
+        return self._VALID_KEYS if self.valid else self._INVALID_KEYS
+    
+    def __getitem__(self, key):
+        if key not in self._keys():
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in self._keys()
+    
+    def __iter__(self):
+        return iter(self._keys())
+    
+    def __len__(self):
+        return len(self._keys())
+    
+    def to_dict(self):
+        """Return the result as a plain dictionary."""
+        return dict(self.items())
+    
+    def __eq__(self, other):
+        if isinstance(other, ParityResult):
+            return self.number == other.number
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+    
+    def __repr__(self):
+        return f"ParityResult({self.number!r})"
+
+
+class ParityResultBatch:
+    """
+    Struct-of-arrays store for many parity results.
+    
+    Numbers, remainders and validity flags live in parallel typed arrays
+    (8 + 1 + 1 bytes per value) instead of one object per result; the
+    classification follows from the remainder. Indexing returns a
+    ParityResult. Integers outside the int64 range (and bools) are kept in
+    a side table.
+    
+    Args:
+        values (iterable): Values to classify, as accepted by
+                           check_even_or_odd
+    """
+    
+    def __init__(self, values):
+        self.numbers = array("q")
+        self.remainders = bytearray()
+        self.valid = bytearray()
+        self._big_numbers = {}
+        
+        for value in values:
+            number = _parse_integer(value)
+            if number is None:
+                self.numbers.append(0)
+                self.remainders.append(0)
+                self.valid.append(0)
+                continue
+            
+            # bools and integers beyond int64 keep their original object
+            if type(number) is int and -2 ** 63 <= number < 2 ** 63:
+                self.numbers.append(number)
+            else:
+                self._big_numbers[len(self.valid)] = number
+                self.numbers.append(0)
+            self.remainders.append(number % 2)
+            self.valid.append(1)
+    
+    def __len__(self):
+        return len(self.valid)
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("batch index out of range")
+        if not self.valid[index]:
+            return ParityResult(None)
+        return ParityResult(self._big_numbers.get(index, self.numbers[index]))
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+    
+    def even_count(self):
+        """Count the valid even numbers."""
+        return self.valid.count(1) - self.remainders.count(1)
+    
+    def odd_count(self):
+        """Count the odd numbers."""
+        return self.remainders.count(1)
+    
+    def invalid_count(self):
+        """Count the values that could not be classified."""
+        return self.valid.count(0)
+
+
+def check_even_or_odd_verbose(num):
+    """
+    Check whether a number is even or odd with detailed output.
+    
+    Args:
+        num: The value to check
+        
+    Returns:
+        ParityResult: Classification and details as a read-only mapping
+                      (keys: valid, number, classification, message,
+                      divisible_by_2, remainder); use to_dict() for a dict
+    """
+    return ParityResult(_parse_integer(num))
+
+
+def check_even_or_odd_batch(values):
+    """
+    Classify many values at once into a compact ParityResultBatch.
+    
+    Args:
+        values (iterable): Values to check
+        
+    Returns:
+        ParityResultBatch: Struct-of-arrays results
+    """
+    return ParityResultBatch(values)
 
 
 def is_even(num):
@@ -98,8 +272,94 @@ def is_odd(num):
         return None
 
 
+def classify_parity_batch(values, packed=False):
+    """
+    Classify a whole buffer of numbers as even or odd in one pass.
+    
+    Accepts any buffer-protocol array (array.array, NumPy array, bytes-like
+    memoryview). Parity is a bitwise AND with 1 over the whole buffer, so no
+    Python object is created per value. Floats are truncated toward zero as
+    in check_even_or_odd; NaN and infinity are reported as invalid.
+    
+    Args:
+        values: Buffer of integers (or floats)
+        packed (bool): Return a bytes bitmask, 8 values per byte
+        
+    Returns:
+        tuple: (odd, invalid) where odd is a NumPy bool array (True for odd),
+               or with packed=True a bytes bitmask with the most significant
+               bit first, and invalid is a list of indices that could not be
+               classified (their odd flag is False). Without NumPy the
+               unpacked result is bytes holding one 0/1 byte per value.
+               
+    Raises:
+        TypeError: If values is not a numeric buffer
+    """
+    view = memoryview(values)
+    item_format = view.format.lstrip("@=<>!")
+    
+    if np is not None:
+        array = np.asarray(view).ravel()
+        if array.dtype.kind in "biu":
+            odd = (array & 1).astype(bool)
+            invalid = []
+        elif array.dtype.kind == "f":
+            valid = np.isfinite(array)
+            odd = valid & (np.fmod(np.trunc(np.where(valid, array, 0)), 2) != 0)
+            invalid = np.flatnonzero(~valid).tolist()
+        else:
+            raise TypeError("values must be a buffer of integers or floats")
+        
+        if packed:
+            return np.packbits(odd).tobytes(), invalid
+        return odd, invalid
+    
+    if item_format in _INTEGER_FORMATS and view.c_contiguous:
+        # The low bit lives in the first byte (little-endian) or the last
+        raw = view.cast("B")
+        size = view.itemsize
+        order = view.format[0] if view.format[0] in "@=<>!" else "@"
+        little = order == "<" or (order in "@=" and sys.byteorder == "little")
+        low_bytes = raw[0::size] if little else raw[size - 1::size]
+        odd = bytes(low_bytes).translate(_LOW_BIT)
+        invalid = []
+    elif item_format in ("f", "d", "e"):
+        flags = bytearray(view.nbytes // view.itemsize)
+        invalid = []
+        for index, value in enumerate(view.cast("B").cast(item_format)):
+            if value != value or value in (float("inf"), float("-inf")):
+                invalid.append(index)
+            else:
+                flags[index] = int(value) & 1
+        odd = bytes(flags)
+    else:
+        raise TypeError("values must be a contiguous buffer of integers or floats")
+    
+    if packed:
+        return pack_bits(odd), invalid
+    return odd, invalid
+
+
+def parity_codes(values):
+    """
+    Batch classifier for the streaming mode: 0 = Even, 1 = Odd.
+    
+    Args:
+        values (list): Parsed integers (None for invalid tokens)
+        
+    Returns:
+        bytes: One code per value
+    """
+    return bytes([INVALID_CODE if num is None else num & 1 for num in values])
+
+
 # Interactive mode and demonstrations
 if __name__ == "__main__":
+    # Non-interactive bulk mode: python "Even or Odd.py" --stream [--input FILE]
+    if "--stream" in sys.argv[1:]:
+        sys.exit(stream_main(sys.argv[1:], parity_codes, ("Even", "Odd"),
+                             "Classify a stream of integers as even or odd."))
+    
     print("=" * 70)
     print("EVEN OR ODD CHECKER WITH INPUT VALIDATION")
     print("=" * 70)
@@ -180,6 +440,32 @@ if __name__ == "__main__":
         else:
             print(f"Error: {info['message']}\n")
     
+    # Compact struct-of-arrays results
+    print("=" * 70)
+    print("Compact Batch Results:")
+    print("=" * 70 + "\n")
+    
+    results = check_even_or_odd_batch([8, "15", "abc", -4, 2 ** 70 + 1])
+    for info in results:
+        print(f"{info['message']}")
+    print(f"\nEven: {results.even_count()}, Odd: {results.odd_count()}, "
+          f"Invalid: {results.invalid_count()}\n")
+    
+    # Batch classification over a buffer
+    print("=" * 70)
+    print("Batch Classification (Buffer Protocol):")
+    print("=" * 70 + "\n")
+    
+    batch = array("q", [8, 15, 0, -3, 100, 7, 2, 9, 11])
+    odd, invalid = classify_parity_batch(batch, packed=True)
+    print(f"Values: {batch.tolist()}")
+    print(f"Packed odd mask: {odd.hex()} (invalid indices: {invalid})")
+    
+    floats = array("d", [4.0, 7.0, float("nan"), -3.0])
+    odd, invalid = classify_parity_batch(floats, packed=True)
+    print(f"Values: {floats.tolist()}")
+    print(f"Packed odd mask: {odd.hex()} (invalid indices: {invalid})\n")
+    
     # Interactive mode
     print("=" * 70)
     print("Interactive Mode:")
@@ -1,3 +1,71 @@
+import math
+from array import array
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+from digit_engine import to_decimal_string
+
+
+# Ranges shorter than this are multiplied directly instead of split further
+_LEAF_SIZE = 16
+
+# Prefix table of exact factorials: _factorial_cache[k] == k!
+_factorial_cache = [1, 1]
+
+# Factorials larger than this many bits are never cached
+_FACTORIAL_CACHE_MAX_BITS = 1 << 16
+
+
+def _odd_product(lo, hi):
+    """
+    Multiply the odd numbers lo, lo + 2, ..., hi by binary splitting.
+    
+    Splitting keeps the two factors of every multiplication about the same
+    size, which is what lets large multiplications stay fast.
+    
+    Args:
+        lo (int): First odd factor
+        hi (int): Last odd factor
+        
+    Returns:
+        int: The product (1 if lo > hi)
+    """
+    if hi - lo < 2 * _LEAF_SIZE:
+        result = 1
+        for i in range(lo, hi + 1, 2):
+            result *= i
+        return result
+    
+    mid = (lo + hi) // 2 | 1
+    return _odd_product(lo, mid - 2) * _odd_product(mid, hi)
+
+
+def _binary_split_factorial(n):
+    """
+    Compute n! as its odd part shifted left by the power of two in n!.
+    
+    The odd part is the product over i >= 1 of the odd numbers in
+    (n >> i, n >> (i - 1)], each raised to the power i. It is accumulated
+    from the top bit down, so every odd number is multiplied in only once.
+    
+    Args:
+        n (int): A non-negative integer
+        
+    Returns:
+        int: n!
+    """
+    inner = 1
+    outer = 1
+    for i in range(n.bit_length() - 1, -1, -1):
+        lo = ((n >> (i + 1)) + 1) | 1
+        hi = ((n >> i) - 1) | 1
+        inner *= _odd_product(lo, hi)
+        outer *= inner
+    
+    # Legendre: the exponent of 2 in n! is n minus the number of 1 bits in n
+    return outer << (n - bin(n).count("1"))
+
+
 def factorial(n):
     """
     Calculate the factorial of a given number.
@@ -20,18 +88,28 @@ def factorial(n):
     if n == 0 or n == 1:
         return 1
     
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    
-    return result
+    return _binary_split_factorial(n)
 
 
 # Alternative recursive approach
+def _range_product(lo, hi):
+    """Multiply lo..hi by recursively splitting the range in half."""
+    if lo > hi:
+        return 1
+    if lo == hi:
+        return lo
+    
+    mid = (lo + hi) // 2
+    return _range_product(lo, mid) * _range_product(mid + 1, hi)
+
+
 def factorial_recursive(n):
     """
     Calculate the factorial of a given number using recursion.
     
+    The recursion splits 2..n in half rather than peeling off one factor
+    per call, so the stack depth is about log2(n) instead of n.
+    
     Args:
         n (int): A non-negative integer
         
@@ -47,7 +125,414 @@ def factorial_recursive(n):
     if n == 0 or n == 1:
         return 1
     
-    return n * factorial_recursive(n - 1)
+    return _range_product(2, n)
+
+
+def cached_factorial(n):
+    """
+    Calculate n! using a shared prefix table of previously computed values.
+    
+    The table is extended incrementally, so overlapping calls only pay for
+    the factors not seen before. Results above _FACTORIAL_CACHE_MAX_BITS
+    bits are computed with factorial() and not stored.
+    
+    Args:
+        n (int): A non-negative integer
+        
+    Returns:
+        int: The factorial of n
+        
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    
+    if n < len(_factorial_cache):
+        return _factorial_cache[n]
+    
+    # log2(n!) from lgamma decides whether n! may enter the table
+    if math.lgamma(n + 1) / math.log(2) > _FACTORIAL_CACHE_MAX_BITS:
+        return factorial(n)
+    
+    value = _factorial_cache[-1]
+    for k in range(len(_factorial_cache), n + 1):
+        value *= k
+        _factorial_cache.append(value)
+    
+    return value
+
+
+def trim_factorial_cache(max_bits=None):
+    """
+    Evict cached factorials larger than max_bits bits.
+    
+    Args:
+        max_bits (int, optional): Size limit; defaults to the current
+                                  _FACTORIAL_CACHE_MAX_BITS. Use 0 to
+                                  clear everything but 0! and 1!.
+    """
+    global _FACTORIAL_CACHE_MAX_BITS
+    
+    if max_bits is not None:
+        _FACTORIAL_CACHE_MAX_BITS = max_bits
+    
+    # The table is a prefix, so evicting huge entries means truncating it
+    keep = 2
+    while keep < len(_factorial_cache) and _factorial_cache[keep].bit_length() <= _FACTORIAL_CACHE_MAX_BITS:
+        keep += 1
+    del _factorial_cache[keep:]
+
+
+def modular_factorial_tables(limit, p):
+    """
+    Precompute k! mod p and (k!)^-1 mod p for k = 0..limit in O(limit).
+    
+    Args:
+        limit (int): Largest k to tabulate (capped at p - 1)
+        p (int): A prime modulus below 2**63
+        
+    Returns:
+        tuple: (fact, inv_fact) arrays of unsigned 64-bit integers
+    """
+    if p < 2:
+        raise ValueError("Modulus must be a prime")
+    
+    # Beyond p - 1 every factorial is 0 mod p and has no inverse
+    limit = min(limit, p - 1)
+    
+    fact = array("Q", [1]) * (limit + 1)
+    for k in range(2, limit + 1):
+        fact[k] = fact[k - 1] * k % p
+    
+    # One modular exponentiation, then walk the inverses back down
+    inv_fact = array("Q", [1]) * (limit + 1)
+    inv_fact[limit] = pow(fact[limit], p - 2, p)
+    for k in range(limit, 1, -1):
+        inv_fact[k - 1] = inv_fact[k] * k % p
+    
+    return fact, inv_fact
+
+
+def factorial_mod(n, p, tables=None):
+    """
+    Calculate n! mod p without computing n!.
+    
+    Args:
+        n (int): A non-negative integer
+        p (int): The modulus (any integer >= 2, prime when tables are used)
+        tables (tuple, optional): Result of modular_factorial_tables for p
+        
+    Returns:
+        int: n! mod p
+        
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    
+    # p itself is one of the factors of n! once n >= p
+    if n >= p:
+        return 0
+    
+    if tables is not None and n < len(tables[0]):
+        return tables[0][n]
+    
+    result = 1
+    for i in range(2, n + 1):
+        result = result * i % p
+    return result % p
+
+
+def _lucas_digits(n, k, p):
+    """Yield the base-p digit pairs (n_digit, k_digit) of n and k, lowest first."""
+    while n or k:
+        yield n % p, k % p
+        n //= p
+        k //= p
+
+
+def _small_binomial_mod(n, k, p, tables=None):
+    """
+    C(n, k) mod p for 0 <= k <= n < p.
+    
+    Uses the tables when they reach n, otherwise a direct product of
+    min(k, n - k) terms and a single modular inverse.
+    """
+    if tables is not None and n < len(tables[0]):
+        fact, inv_fact = tables
+        return fact[n] * inv_fact[k] % p * inv_fact[n - k] % p
+    
+    k = min(k, n - k)
+    numerator = denominator = 1
+    for i in range(k):
+        numerator = numerator * (n - i) % p
+        denominator = denominator * (i + 1) % p
+    return numerator * pow(denominator, p - 2, p) % p
+
+
+def binomial_mod(n, k, p, tables=None):
+    """
+    Calculate C(n, k) mod p for a prime p.
+    
+    Lucas' theorem splits n and k into base-p digits, and each digit pair
+    is looked up in the tables when they cover it. Without tables no
+    table is built: each digit pair costs a direct product of
+    min(k_digit, n_digit - k_digit) terms plus one modular inverse, which
+    suits one-off calls with small k. With tables covering every base-p
+    digit of n a call costs O(log_p n).
+    
+    Args:
+        n (int): Number of items
+        k (int): Number of items chosen
+        p (int): A prime modulus below 2**63
+        tables (tuple, optional): Result of modular_factorial_tables for p
+        
+    Returns:
+        int: C(n, k) mod p (0 if k < 0 or k > n)
+    """
+    if k < 0 or k > n:
+        return 0
+    
+    result = 1
+    for n_digit, k_digit in _lucas_digits(n, k, p):
+        if k_digit > n_digit:
+            return 0
+        result = result * _small_binomial_mod(n_digit, k_digit, p, tables) % p
+    
+    return result
+
+
+def binomial_mod_batch(queries, p):
+    """
+    Calculate C(n, k) mod p for many (n, k) pairs.
+    
+    The factorial tables are built once, only up to the largest base-p
+    digit of any n (so never beyond p - 1), after which every query costs
+    O(log_p n). When the direct products for all queries are cheaper than
+    building those tables, no tables are built.
+    
+    Args:
+        queries (iterable): (n, k) pairs
+        p (int): A prime modulus below 2**63
+        
+    Returns:
+        list: C(n, k) mod p for each query, in order
+    """
+    queries = list(queries)
+    if not queries:
+        return []
+    
+    # Table size needed versus total work of the direct products
+    limit = direct_cost = 0
+    for n, k in queries:
+        if 0 <= k <= n:
+            for n_digit, k_digit in _lucas_digits(n, k, p):
+                limit = max(limit, n_digit)
+                direct_cost += min(k_digit, max(n_digit - k_digit, 0))
+    
+    tables = modular_factorial_tables(limit, p) if limit <= direct_cost else None
+    
+    results = []
+    for n, k in queries:
+        if tables is not None and 0 <= k <= n < p:
+            fact, inv_fact = tables
+            results.append(fact[n] * inv_fact[k] % p * inv_fact[n - k] % p)
+        else:
+            results.append(binomial_mod(n, k, p, tables))
+    return results
+
+
+# Below this n, factorial_info simply builds n! (cheap, and within the
+# 4300-digit limit of str() on ints)
+_EXACT_INFO_LIMIT = 1000
+
+# factorial_info builds n! exactly for leading digits when n! has at most
+# this many digits per leading digit requested; beyond that the Stirling
+# series is cheaper (they break even near 1600 on 10**6!)
+_EXACT_LEADING_RATIO = 1000
+
+# Relative accuracy assumed for math.lgamma when deciding the digit count
+_LGAMMA_RELATIVE_ERROR = 1e-14
+
+
+def factorial_prime_exponent(n, p):
+    """
+    Find the exponent of the prime p in n! with Legendre's formula.
+    
+    Args:
+        n (int): A non-negative integer
+        p (int): A prime
+        
+    Returns:
+        int: The sum of n // p**i for i >= 1
+    """
+    exponent = 0
+    while n:
+        n //= p
+        exponent += n
+    return exponent
+
+
+def _decimal_pi():
+    """Compute pi to the current decimal precision (Python decimal recipe)."""
+    with localcontext() as ctx:
+        ctx.prec += 2
+        three = Decimal(3)
+        lasts, t, total, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while total != lasts:
+            lasts = total
+            n, na = n + na, na + 8
+            d, da = d + da, da + 32
+            t = (t * n) / d
+            total += t
+    return +total
+
+
+# Akiyama-Tanigawa working row and the even Bernoulli numbers found so far;
+# both only ever grow, so later calls resume where earlier ones stopped
+_bernoulli_row = []
+_bernoulli_cache = []
+
+
+def _bernoulli_numbers(count):
+    """Return B_2, B_4, ..., B_2count as Fractions (Akiyama-Tanigawa)."""
+    row = _bernoulli_row
+    while len(_bernoulli_cache) < count:
+        m = len(row)
+        row.append(Fraction(1, m + 1))
+        for j in range(m, 0, -1):
+            row[j - 1] = j * (row[j - 1] - row[j])
+        if m >= 2 and m % 2 == 0:
+            _bernoulli_cache.append(row[0])
+    return _bernoulli_cache[:count]
+
+
+def _log10_factorial(n, digits):
+    """
+    Compute log10(n!) with the Stirling series in decimal arithmetic.
+    
+    Terms are added until the next one, which bounds the truncation error
+    of the series, drops below 10**-digits.
+    
+    Args:
+        n (int): A positive integer
+        digits (int): Number of correct digits wanted after the decimal point
+        
+    Returns:
+        Decimal: log10(n!) accurate to about 10**-digits
+    """
+    with localcontext() as ctx:
+        # Integer digits of ln(n!) plus the fractional digits wanted
+        ctx.prec = len(str(n)) * 2 + digits + 10
+        N = Decimal(n)
+        ln_factorial = N * N.ln() - N + (2 * _decimal_pi() * N).ln() / 2
+        
+        tolerance = Decimal(10) ** -(digits + 5)
+        count = 4
+        while True:
+            bernoulli = _bernoulli_numbers(count)
+            total = Decimal(0)
+            converged = False
+            for k, b in enumerate(bernoulli, start=1):
+                term = Decimal(b.numerator) / (Decimal(b.denominator) * (2 * k) * (2 * k - 1) * N ** (2 * k - 1))
+                if abs(term) < tolerance:
+                    converged = True
+                    break
+                total += term
+            if converged:
+                break
+            count *= 2
+        
+        return (ln_factorial + total) / Decimal(10).ln()
+
+
+def factorial_info(n, leading_digits=0, primes=()):
+    """
+    Describe n! without computing it.
+    
+    The digit count comes from math.lgamma, unless lgamma's error bound
+    leaves it in doubt, in which case the decimal Stirling series decides.
+    Trailing zeros and prime exponents use Legendre's formula. Leading
+    digits are exact: precision is raised until they are unambiguous, and
+    when they reach into the trailing zeros or cover a large share of n!,
+    n! is computed exactly instead.
+    
+    Args:
+        n (int): A non-negative integer
+        leading_digits (int): How many leading digits to return (0 for none)
+        primes (iterable): Primes whose exponent in n! should be reported
+        
+    Returns:
+        dict: Dictionary containing the following keys:
+            - 'n' (int): The input
+            - 'digits' (int): Number of decimal digits of n!
+            - 'trailing_zeros' (int): Number of trailing zeros of n!
+            - 'log10' (float): log10(n!) from math.lgamma
+            - 'log10_error' (float): Error bound used for 'log10'
+            - 'leading_digits' (int or None): First leading_digits digits
+            - 'prime_exponents' (dict): {p: exponent of p in n!}
+        
+    Raises:
+        ValueError: If n is negative
+    """
+    if n < 0:
+        raise ValueError("Factorial is not defined for negative numbers")
+    
+    log10 = math.lgamma(n + 1) / math.log(10)
+    log10_error = abs(log10) * _LGAMMA_RELATIVE_ERROR + 1e-15
+    info = {
+        "n": n,
+        "log10": log10,
+        "log10_error": log10_error,
+        "trailing_zeros": factorial_prime_exponent(n, 5),
+        "prime_exponents": {p: factorial_prime_exponent(n, p) for p in primes},
+        "leading_digits": None,
+    }
+    
+    if n < _EXACT_INFO_LIMIT:
+        digits_str = str(factorial(n))
+        info["digits"] = len(digits_str)
+        if leading_digits:
+            info["leading_digits"] = int(digits_str[:leading_digits])
+        return info
+    
+    # lgamma settles the digit count unless log10(n!) is too close to an integer
+    fraction = log10 - math.floor(log10)
+    if log10_error < fraction < 1 - log10_error:
+        info["digits"] = math.floor(log10) + 1
+    else:
+        info["digits"] = int(_log10_factorial(n, 20)) + 1
+    
+    if leading_digits:
+        leading_digits = min(leading_digits, info["digits"])
+        significant = info["digits"] - info["trailing_zeros"]
+        
+        # The series cannot separate digits that are exactly an integer
+        # (everything up to the trailing zeros), and for many digits its
+        # Bernoulli terms cost more than the exact product
+        if leading_digits >= significant or info["digits"] <= _EXACT_LEADING_RATIO * leading_digits:
+            info["leading_digits"] = int(to_decimal_string(factorial(n))[:leading_digits])
+            return info
+        
+        guard = 10
+        while True:
+            precise = _log10_factorial(n, leading_digits + guard)
+            with localcontext() as ctx:
+                ctx.prec = len(str(info["digits"])) + leading_digits + guard + 10
+                scaled = Decimal(10) ** (precise - int(precise) + leading_digits - 1)
+                candidate = int(scaled)
+                # Accept only when the error cannot push us across an integer;
+                # log10 is good to 10**-(leading_digits + guard), so scaled
+                # is good to about that many significant digits
+                margin = scaled * Decimal(10) ** -(leading_digits + guard - 2)
+                if scaled - candidate > margin and candidate + 1 - scaled > margin:
+                    break
+            guard *= 2
+        info["leading_digits"] = candidate
+    
+    return info
 
 
 # Test cases
@@ -66,3 +551,33 @@ if __name__ == "__main__":
     
     # Example from user request
     print(f"\nExample: factorial(5) = {factorial(5)}")
+    
+    # Large inputs
+    import time
+    
+    print("\nLarge Inputs:")
+    for num in [5000, 100000, 300000]:
+        start_time = time.perf_counter()
+        result = factorial(num)
+        elapsed = time.perf_counter() - start_time
+        print(f"factorial({num}) has {result.bit_length()} bits ({elapsed:.3f}s)")
+    
+    print(f"factorial_recursive(5000) == factorial(5000): {factorial_recursive(5000) == factorial(5000)}")
+    
+    # Cached and modular factorials
+    print("\nCached and Modular Factorials:")
+    print(f"cached_factorial(20) = {cached_factorial(20)}")
+    print(f"Cached entries: {len(_factorial_cache)}")
+    
+    MOD = 1000000007
+    print(f"factorial_mod(100000, {MOD}) = {factorial_mod(100000, MOD)}")
+    print(f"binomial_mod(1000000, 500000, {MOD}) = {binomial_mod(1000000, 500000, MOD)}")
+    print(f"binomial_mod_batch([(10, 3), (52, 5), (100, 50)], {MOD}) = "
+          f"{binomial_mod_batch([(10, 3), (52, 5), (100, 50)], MOD)}")
+    
+    # Metadata without building n!
+    print("\nFactorial Metadata:")
+    for num in [100, 1000000, 10 ** 12]:
+        info = factorial_info(num, leading_digits=10, primes=[2, 7])
+        print(f"{num}!: {info['digits']} digits, {info['trailing_zeros']} trailing zeros, "
+              f"starts with {info['leading_digits']}, exponents {info['prime_exponents']}")
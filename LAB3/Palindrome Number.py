@@ -1,3 +1,6 @@
+from digit_engine import to_digits
+
+
 def is_palindrome(num):
     """
     Check whether a given number is a palindrome or not.
@@ -12,9 +15,132 @@ def is_palindrome(num):
     if num < 0:
         return False
     
-    # Convert to string and check if it's the same as its reverse
-    num_str = str(num)
-    return num_str == num_str[::-1]
+    # Compare the digit array with its reverse (works past str()'s size limit)
+    digits = to_digits(num)
+    return digits == digits[::-1]
+
+
+def _palindrome_from_prefix(prefix, length):
+    """
+    Build the palindrome of the given length whose first half is prefix.
+    
+    Args:
+        prefix (int): The first (length + 1) // 2 digits
+        length (int): Number of digits of the palindrome
+        
+    Returns:
+        int: The palindrome
+    """
+    prefix_str = str(prefix)
+    return int(prefix_str + prefix_str[:length // 2][::-1])
+
+
+def iter_palindromes(lo, hi):
+    """
+    Generate all palindromic numbers in [lo, hi] in ascending order.
+    
+    Palindromes are built directly from their half-prefixes, so the cost is
+    proportional to the number of palindromes (about the square root of
+    the range size) rather than the size of the range.
+    
+    Args:
+        lo (int): Start of the range (inclusive)
+        hi (int): End of the range (inclusive)
+        
+    Yields:
+        int: Palindromes in ascending order
+    """
+    # Negative numbers are not palindromes
+    lo = max(lo, 0)
+    if lo > hi:
+        return
+    
+    for length in range(len(str(lo)), len(str(hi)) + 1):
+        half = (length + 1) // 2
+        first = 0 if length == 1 else 10 ** (half - 1)
+        
+        # Start at lo's own prefix when lo has this many digits
+        if length == len(str(lo)):
+            prefix = int(str(lo)[:half])
+            if _palindrome_from_prefix(prefix, length) < lo:
+                prefix += 1
+        else:
+            prefix = first
+        
+        for prefix in range(prefix, 10 ** half):
+            palindrome = _palindrome_from_prefix(prefix, length)
+            if palindrome > hi:
+                return
+            yield palindrome
+
+
+def _count_palindromes_upto(x):
+    """Count the palindromic numbers in [0, x]."""
+    if x < 0:
+        return 0
+    
+    x_str = str(x)
+    length = len(x_str)
+    if length == 1:
+        return x + 1
+    
+    # All shorter lengths: 10 one-digit palindromes, then 9 * 10^(half - 1)
+    count = 10 + sum(9 * 10 ** ((digits + 1) // 2 - 1) for digits in range(2, length))
+    
+    # Same length: every smaller prefix, plus x's own prefix if it fits
+    half = (length + 1) // 2
+    prefix = int(x_str[:half])
+    count += prefix - 10 ** (half - 1)
+    if _palindrome_from_prefix(prefix, length) <= x:
+        count += 1
+    
+    return count
+
+
+def count_palindromes(lo, hi):
+    """
+    Count the palindromic numbers in [lo, hi] without generating them.
+    
+    Args:
+        lo (int): Start of the range (inclusive)
+        hi (int): End of the range (inclusive)
+        
+    Returns:
+        int: Number of palindromes in the range
+    """
+    if lo > hi:
+        return 0
+    return _count_palindromes_upto(hi) - _count_palindromes_upto(lo - 1)
+
+
+def nth_palindrome(k):
+    """
+    Find the k-th palindromic number, counting 0 as the first.
+    
+    Args:
+        k (int): 1-based position in the sequence 0, 1, ..., 9, 11, 22, ...
+        
+    Returns:
+        int: The k-th palindrome
+        
+    Raises:
+        ValueError: If k < 1
+    """
+    if k < 1:
+        raise ValueError("k must be a positive integer")
+    
+    if k <= 10:
+        return k - 1
+    k -= 10
+    
+    length = 2
+    while True:
+        half = (length + 1) // 2
+        count = 9 * 10 ** (half - 1)
+        if k <= count:
+            return _palindrome_from_prefix(10 ** (half - 1) + k - 1, length)
+        k -= count
+        length += 1
 
 
 # Test cases
@@ -24,3 +150,12 @@ if __name__ == "__main__":
     for num in test_cases:
         result = is_palindrome(num)
         print(f"{num}: {result}")
+    
+    # Range queries
+    print(f"\nPalindromes in [100, 200]: {list(iter_palindromes(100, 200))}")
+    print(f"Palindromes in [1, 10^12]: {count_palindromes(1, 10 ** 12)}")
+    print(f"1,000,000th palindrome: {nth_palindrome(1000000)}")
+    
+    # Huge inputs
+    huge = 10 ** 100000 + 1
+    print(f"\nis_palindrome(10^100000 + 1): {is_palindrome(huge)}")
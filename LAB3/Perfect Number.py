@@ -1,4 +1,16 @@
+import heapq
+import itertools
 import math
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the divisor-sum sieve falls back to array
+    np = None
+
+
+# Gaps between successive candidates coprime to 2, 3 and 5, starting at 7
+_WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)
 
 
 def is_perfect_number(num):
@@ -26,6 +38,12 @@ def is_perfect_number(num):
     if num == 1:
         return False
     
+    # Every even perfect number is 2^(p-1) * (2^p - 1) with 2^p - 1 prime;
+    # the bit tricks need an int, other numeric types use trial division
+    if isinstance(num, int) and num % 2 == 0:
+        p = (num & -num).bit_length()
+        return num >> (p - 1) == (1 << p) - 1 and _is_small_prime(p) and lucas_lehmer(p)
+    
     # Calculate the sum of proper divisors
     divisor_sum = 1  # 1 is always a divisor for num > 1
     
@@ -42,12 +60,107 @@ def is_perfect_number(num):
     return divisor_sum == num
 
 
-def get_perfect_number_info(num):
+def prime_factorization(num):
+    """
+    Factor a positive integer by trial division with a 2-3-5 wheel.
+    
+    Args:
+        num (int): A positive integer
+        
+    Returns:
+        list: (prime, exponent) tuples in ascending order of prime
+    """
+    factors = []
+    for p in (2, 3, 5):
+        exponent = 0
+        while num % p == 0:
+            num //= p
+            exponent += 1
+        if exponent:
+            factors.append((p, exponent))
+    
+    # Only candidates coprime to 30 are tried past 5
+    p = 7
+    gap = 0
+    while p * p <= num:
+        exponent = 0
+        while num % p == 0:
+            num //= p
+            exponent += 1
+        if exponent:
+            factors.append((p, exponent))
+        p += _WHEEL_GAPS[gap]
+        gap = (gap + 1) % len(_WHEEL_GAPS)
+    
+    if num > 1:
+        factors.append((num, 1))
+    
+    return factors
+
+
+def iter_divisors(num, proper=True):
+    """
+    Lazily generate the divisors of a number in ascending order.
+    
+    Divisors are built from the prime factorization with a min-heap, so the
+    next divisor is produced without enumerating or storing all of them.
+    
+    Args:
+        num (int): A positive integer
+        proper (bool): Exclude num itself
+        
+    Yields:
+        int: Divisors of num in ascending order
+    """
+    factors = prime_factorization(num)
+    
+    # Each divisor is reached once, by multiplying primes in index order;
+    # entries are (divisor, index of its largest prime, exponent of that prime)
+    heap = [(1, -1, 0)]
+    while heap:
+        divisor, index, exponent = heapq.heappop(heap)
+        if proper and divisor == num:
+            return
+        yield divisor
+        
+        if index >= 0 and exponent < factors[index][1]:
+            heapq.heappush(heap, (divisor * factors[index][0], index, exponent + 1))
+        for next_index in range(index + 1, len(factors)):
+            heapq.heappush(heap, (divisor * factors[next_index][0], next_index, 1))
+
+
+def divisor_count_and_sum(num, proper=True):
+    """
+    Compute the number and sum of the divisors of a number from its prime
+    factorization, without listing the divisors.
+    
+    Args:
+        num (int): A positive integer
+        proper (bool): Exclude num itself
+        
+    Returns:
+        tuple: (count, sum) of the divisors
+    """
+    count = 1
+    total = 1
+    for p, exponent in prime_factorization(num):
+        count *= exponent + 1
+        total *= (p ** (exponent + 1) - 1) // (p - 1)
+    
+    if proper:
+        return count - 1, total - num
+    return count, total
+
+
+def get_perfect_number_info(num, include_divisors=True):
     """
     Get detailed information about whether a number is perfect.
     
     Args:
         num (int): The number to check
+        include_divisors (bool): Build the list of proper divisors; when
+                                 False, "divisors" is None and only the
+                                 count and sum are computed
         
     Returns:
         dict: Dictionary containing classification and divisors
@@ -60,24 +173,142 @@ def get_perfect_number_info(num):
             "divisors": []
         }
     
-    # Find all proper divisors
-    divisors = []
-    for i in range(1, num):
-        if num % i == 0:
-            divisors.append(i)
-    
-    divisor_sum = sum(divisors)
+    divisor_count, divisor_sum = divisor_count_and_sum(num)
+    divisors = list(iter_divisors(num)) if include_divisors else None
     is_perfect = divisor_sum == num
     
     return {
         "number": num,
         "is_perfect": is_perfect,
         "divisors": divisors,
+        "divisor_count": divisor_count,
         "sum_of_divisors": divisor_sum,
         "message": f"{num} is {'a Perfect Number' if is_perfect else 'NOT a Perfect Number'}"
     }
 
 
+def _is_small_prime(num):
+    """Trial-division primality check for Mersenne exponents."""
+    if num < 2:
+        return False
+    return all(num % i for i in range(2, math.isqrt(num) + 1))
+
+
+def lucas_lehmer(p):
+    """
+    Test whether the Mersenne number 2^p - 1 is prime.
+    
+    Args:
+        p (int): A prime exponent
+        
+    Returns:
+        bool: True if 2^p - 1 is prime
+    """
+    if p == 2:
+        return True
+    
+    mersenne = (1 << p) - 1
+    s = 4
+    for _ in range(p - 2):
+        s = s * s - 2
+        # Reduce modulo 2^p - 1 with shifts: 2^p is congruent to 1
+        s = (s & mersenne) + (s >> p)
+        if s >= mersenne:
+            s -= mersenne
+    
+    return s == 0
+
+
+def iter_even_perfect_numbers():
+    """
+    Generate the even perfect numbers in ascending order.
+    
+    By the Euclid-Euler theorem these are exactly 2^(p-1) * (2^p - 1) for
+    the primes p where 2^p - 1 is prime, checked with the Lucas-Lehmer test.
+    
+    Yields:
+        int: 6, 28, 496, 8128, 33550336, ...
+    """
+    for p in itertools.count(2):
+        if _is_small_prime(p) and lucas_lehmer(p):
+            yield (1 << (p - 1)) * ((1 << p) - 1)
+
+
+def perfect_numbers_below(bound):
+    """
+    List all even perfect numbers below a bound, however large.
+    
+    Args:
+        bound (int): Exclusive upper bound
+        
+    Returns:
+        list: Even perfect numbers below bound
+    """
+    return list(itertools.takewhile(lambda num: num < bound, iter_even_perfect_numbers()))
+
+
+def first_perfect_numbers(count):
+    """
+    List the first count even perfect numbers.
+    
+    Args:
+        count (int): How many perfect numbers to return
+        
+    Returns:
+        list: The first count even perfect numbers
+    """
+    return list(itertools.islice(iter_even_perfect_numbers(), count))
+
+
+def proper_divisor_sums(limit):
+    """
+    Compute the sum of proper divisors of every number up to a limit.
+    
+    Uses a divisor-sum sieve: each d is added to all of its multiples, which
+    costs O(limit log limit) in total instead of a sqrt(n) scan per number.
+    With NumPy every update is a strided slice, so only about 2*sqrt(limit)
+    Python-level steps remain; otherwise a pure-Python loop is used.
+    
+    Args:
+        limit (int): The upper limit (inclusive)
+        
+    Returns:
+        array or numpy.ndarray: Unsigned 64-bit array where sums[n] is the
+                                sum of the proper divisors of n (sums[0] and
+                                sums[1] are 0)
+    """
+    limit = max(limit, 0)
+    if np is not None:
+        return _proper_divisor_sums_numpy(limit)
+    
+    sums = array("Q", bytes(8 * (limit + 1)))
+    for d in range(1, limit // 2 + 1):
+        for multiple in range(2 * d, limit + 1, d):
+            sums[multiple] += d
+    return sums
+
+
+def _proper_divisor_sums_numpy(limit):
+    """
+    Vectorized divisor-sum sieve behind proper_divisor_sums.
+    
+    Every pair d * q <= limit with q >= 2 adds d to sums[d * q]. Small
+    divisors (d <= root) add themselves to all their multiples; for large
+    divisors the cofactor q is small, so each q adds the whole run of large
+    d values to sums[q * d] in one slice.
+    """
+    sums = np.zeros(limit + 1, dtype=np.uint64)
+    root = math.isqrt(limit)
+    
+    for d in range(1, root + 1):
+        sums[2 * d::d] += np.uint64(d)
+    
+    for q in range(2, limit // (root + 1) + 1):
+        last = limit // q
+        sums[q * (root + 1):q * last + 1:q] += np.arange(root + 1, last + 1, dtype=np.uint64)
+    return sums
+
+
 def find_perfect_numbers(limit):
     """
     Find all perfect numbers up to a given limit.
@@ -88,11 +319,96 @@ def find_perfect_numbers(limit):
     Returns:
         list: List of perfect numbers up to the limit
     """
-    perfect_numbers = []
+    sums = proper_divisor_sums(limit)
+    if np is not None:
+        return (np.flatnonzero(sums[2:] == np.arange(2, limit + 1, dtype=np.uint64)) + 2).tolist()
+    return [num for num in range(2, limit + 1) if sums[num] == num]
+
+
+def find_abundant_numbers(limit):
+    """
+    Find all abundant numbers (proper divisor sum greater than the number)
+    up to a given limit.
+    
+    Args:
+        limit (int): The upper limit to search
+        
+    Returns:
+        list: List of abundant numbers up to the limit
+    """
+    sums = proper_divisor_sums(limit)
+    if np is not None:
+        return (np.flatnonzero(sums[1:] > np.arange(1, limit + 1, dtype=np.uint64)) + 1).tolist()
+    return [num for num in range(1, limit + 1) if sums[num] > num]
+
+
+def find_deficient_numbers(limit):
+    """
+    Find all deficient numbers (proper divisor sum less than the number)
+    up to a given limit.
+    
+    Args:
+        limit (int): The upper limit to search
+        
+    Returns:
+        list: List of deficient numbers up to the limit
+    """
+    sums = proper_divisor_sums(limit)
+    if np is not None:
+        return (np.flatnonzero(sums[1:] < np.arange(1, limit + 1, dtype=np.uint64)) + 1).tolist()
+    return [num for num in range(1, limit + 1) if sums[num] < num]
+
+
+def find_amicable_pairs(limit):
+    """
+    Find all amicable pairs (a, b) with a < b <= limit, where each number
+    is the sum of the other's proper divisors.
+    
+    Args:
+        limit (int): The upper limit to search
+        
+    Returns:
+        list: List of (a, b) tuples in ascending order of a
+    """
+    sums = proper_divisor_sums(limit)
+    if np is not None:
+        a = np.arange(2, limit + 1, dtype=np.uint64)
+        b = sums[2:]
+        candidates = (a < b) & (b <= limit)
+        a, b = a[candidates], b[candidates]
+        amicable = sums[b.astype(np.intp)] == a
+        return list(zip(a[amicable].tolist(), b[amicable].tolist()))
+    
+    pairs = []
+    for a in range(2, limit + 1):
+        b = sums[a]
+        if a < b <= limit and sums[b] == a:
+            pairs.append((a, b))
+    return pairs
+
+
+def classify_by_divisor_sum(limit):
+    """
+    Classify every number from 1 to limit as Perfect, Abundant or Deficient.
+    
+    Args:
+        limit (int): The upper limit (inclusive)
+        
+    Yields:
+        tuple: (num, classification, sum_of_proper_divisors)
+    """
+    sums = proper_divisor_sums(limit)
+    if np is not None:
+        sums = sums.tolist()
     for num in range(1, limit + 1):
-        if is_perfect_number(num):
-            perfect_numbers.append(num)
-    return perfect_numbers
+        divisor_sum = sums[num]
+        if divisor_sum == num:
+            classification = "Perfect"
+        elif divisor_sum > num:
+            classification = "Abundant"
+        else:
+            classification = "Deficient"
+        yield num, classification, divisor_sum
 
 
 # Test cases and demonstrations
@@ -146,3 +462,42 @@ if __name__ == "__main__":
         result = is_perfect_number(num)
         status = "PERFECT" if result else "NOT PERFECT"
         print(f"{num}: {status}")
+    
+    # Divisor-sum sieve classifications
+    print("\n" + "=" * 80)
+    print("Divisor-Sum Sieve Classifications:")
+    print("=" * 80 + "\n")
+    
+    counts = {"Perfect": 0, "Abundant": 0, "Deficient": 0}
+    for _, classification, _ in classify_by_divisor_sum(100000):
+        counts[classification] += 1
+    print(f"Up to 100,000: {counts}")
+    print(f"Abundant numbers up to 100: {find_abundant_numbers(100)}")
+    print(f"Amicable pairs up to 100,000: {find_amicable_pairs(100000)}")
+    
+    # Factorization-based divisor information
+    print("\n" + "=" * 80)
+    print("Divisor Information from Prime Factorization:")
+    print("=" * 80 + "\n")
+    
+    for num in [100000000, 2305843008139952128]:
+        info = get_perfect_number_info(num, include_divisors=False)
+        print(f"{num}: {info['divisor_count']} proper divisors, sum {info['sum_of_divisors']}")
+        print(f"Result: {info['message']}\n")
+    
+    first_divisors = []
+    for divisor in iter_divisors(100000000):
+        if len(first_divisors) == 10:
+            break
+        first_divisors.append(divisor)
+    print(f"Smallest divisors of 100,000,000: {first_divisors}")
+    
+    # Euclid-Euler generator
+    print("\n" + "=" * 80)
+    print("Even Perfect Numbers via Lucas-Lehmer:")
+    print("=" * 80 + "\n")
+    
+    print(f"Perfect numbers below 10^40: {perfect_numbers_below(10 ** 40)}")
+    twelfth = first_perfect_numbers(12)[-1]
+    print(f"12th perfect number has {len(str(twelfth))} digits")
+    print(f"is_perfect_number(12th perfect number): {is_perfect_number(twelfth)}")
@@ -0,0 +1,19 @@
+def pack_bits(flags):
+    """
+    Pack 0/1 flag bytes into bits, 8 per byte, most significant bit first.
+    
+    Every eighth flag lands in the same bit of consecutive output bytes, so
+    eight big-int shifts pack the whole buffer without a Python loop.
+    
+    Args:
+        flags (bytes-like): One 0/1 byte per value
+        
+    Returns:
+        bytes: Packed bitmask, zero-padded to a whole byte
+    """
+    flags = bytes(flags) + bytes(-len(flags) % 8)
+    packed = 0
+    for bit in range(8):
+        packed |= int.from_bytes(flags[bit::8], "big") << (7 - bit)
+    
+    return packed.to_bytes(len(flags) // 8, "big")
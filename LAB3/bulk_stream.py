@@ -0,0 +1,160 @@
+import argparse
+import sys
+import time
+
+
+# Bytes read from the input per chunk
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Code written for tokens that are not valid integers
+INVALID_CODE = 255
+INVALID_LABEL = "Invalid Input: Please provide a valid integer"
+
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+
+
+def _parse_tokens(tokens):
+    """
+    Convert byte tokens to ints in one bulk call, falling back to a
+    per-token pass (invalid tokens become None) only if that fails.
+    """
+    try:
+        return list(map(int, tokens))
+    except ValueError:
+        values = []
+        for token in tokens:
+            try:
+                values.append(int(token))
+            except ValueError:
+                values.append(None)
+        return values
+
+
+def iter_int_batches(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read whitespace-delimited integers from a binary stream in large chunks.
+    
+    A token cut off at the end of a chunk is carried over to the next one,
+    so numbers may span chunk boundaries.
+    
+    Args:
+        stream: Binary file object (e.g. sys.stdin.buffer)
+        chunk_size (int): Bytes to read per chunk
+    
+    Yields:
+        list: Parsed values of one chunk; invalid tokens are None
+    """
+    leftover = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        
+        data = leftover + chunk
+        cut = max(data.rfind(byte) for byte in _WHITESPACE) + 1
+        leftover = data[cut:]
+        tokens = data[:cut].split()
+        if tokens:
+            yield _parse_tokens(tokens)
+    
+    if leftover.strip():
+        yield _parse_tokens(leftover.split())
+
+
+class _CountingReader:
+    """Wrap a binary stream and count the bytes read from it."""
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes_read = 0
+    
+    def read(self, size):
+        data = self._stream.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def run_stream(classify, labels, source, dest, binary=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Classify every integer in source and write one result per value to dest.
+    
+    Args:
+        classify (callable): Takes a list of ints (None for invalid tokens)
+                             and returns bytes with one code per value
+        labels (sequence): Text for each code in text mode
+        source: Binary input stream
+        dest: Binary output stream
+        binary (bool): Write the raw code bytes instead of text lines
+        chunk_size (int): Bytes to read per chunk
+    
+    Returns:
+        dict: 'values', 'invalid', 'bytes_read' and 'seconds'
+    """
+    # Text lines for every code, encoded once up front
+    lines = [f"{label}\n".encode() for label in labels]
+    lines += [b""] * (INVALID_CODE - len(lines)) + [f"{INVALID_LABEL}\n".encode()]
+    
+    start_time = time.perf_counter()
+    values_seen = 0
+    invalid = 0
+    
+    counting_source = _CountingReader(source)
+    for batch in iter_int_batches(counting_source, chunk_size):
+        codes = classify(batch)
+        values_seen += len(codes)
+        invalid += codes.count(INVALID_CODE)
+        if binary:
+            dest.write(codes)
+        else:
+            dest.write(b"".join([lines[code] for code in codes]))
+    dest.flush()
+    
+    return {
+        "values": values_seen,
+        "invalid": invalid,
+        "bytes_read": counting_source.bytes_read,
+        "seconds": time.perf_counter() - start_time,
+    }
+
+
+def stream_main(argv, classify, labels, description):
+    """
+    Command-line entry point for the non-interactive streaming mode.
+    
+    Args:
+        argv (list): Command-line arguments (without the program name)
+        classify (callable): Batch classifier, see run_stream
+        labels (sequence): Text for each code in text mode
+        description (str): Help text for the command
+    
+    Returns:
+        int: Process exit status
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("--stream", action="store_true",
+                        help="read integers from the input instead of prompting")
+    parser.add_argument("--input", default="-",
+                        help="file of whitespace-delimited integers (default: stdin)")
+    parser.add_argument("--output", default="-",
+                        help="file for the results (default: stdout)")
+    parser.add_argument("--binary", action="store_true",
+                        help=f"write one code byte per value ({INVALID_CODE} = invalid)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="bytes read per chunk")
+    args = parser.parse_args(argv)
+    
+    source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+    dest = sys.stdout.buffer if args.output == "-" else open(args.output, "wb", buffering=1 << 20)
+    try:
+        stats = run_stream(classify, labels, source, dest, args.binary, args.chunk_size)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if dest is not sys.stdout.buffer:
+            dest.close()
+    
+    seconds = max(stats["seconds"], 1e-9)
+    print(f"Classified {stats['values']:,} values ({stats['invalid']:,} invalid) "
+          f"in {stats['seconds']:.2f}s: {stats['values'] / seconds:,.0f} values/s, "
+          f"{stats['bytes_read'] / seconds / 1e6:.1f} MB/s", file=sys.stderr)
+    return 0
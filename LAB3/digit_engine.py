@@ -0,0 +1,123 @@
+import decimal
+from decimal import Decimal
+
+
+# Below this many bits str() is used directly (about 3000 digits, safely
+# under Python's 4300-digit int-to-str limit)
+_DIRECT_BITS = 10000
+
+# Decimal value of 2**bits, keyed by bits; conversions only split on
+# power-of-two bit counts, so this holds O(log) entries reused by every call
+_POWER_TABLE = {}
+
+# Maps ASCII '0'-'9' to the byte values 0-9
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+
+def _split_bits(bits):
+    """Return the largest power of two below bits, the split point used for it."""
+    return 1 << ((bits - 1).bit_length() - 1)
+
+
+def _power_of_two(bits):
+    """Return 2**bits (bits a power of two) as an exact Decimal, caching it."""
+    power = _POWER_TABLE.get(bits)
+    if power is None:
+        if bits <= _DIRECT_BITS:
+            power = Decimal(1 << bits)
+        else:
+            half = bits // 2
+            power = _power_of_two(half) ** 2
+        _POWER_TABLE[bits] = power
+    return power
+
+
+def _to_decimal(num, bits):
+    """
+    Convert a non-negative int of at most bits bits to an exact Decimal.
+    
+    The int is split on a power-of-two bit boundary, which costs only a
+    shift and a mask, and the parts are recombined with decimal
+    multiplication, which is subquadratic for large operands.
+    """
+    if bits <= _DIRECT_BITS:
+        return Decimal(num)
+    
+    half = _split_bits(bits)
+    low = num & ((1 << half) - 1)
+    high = num >> half
+    return _to_decimal(high, bits - half) * _power_of_two(half) + _to_decimal(low, half)
+
+
+def to_decimal_string(num):
+    """
+    Convert an integer of any size to its decimal string.
+    
+    Unlike str(), this is not limited to 4300 digits and runs in
+    subquadratic time for very large integers.
+    
+    Args:
+        num (int): The integer to convert
+    
+    Returns:
+        str: Decimal representation of num, with a leading '-' if negative
+    """
+    if num.bit_length() <= _DIRECT_BITS:
+        return str(num)
+    
+    sign = "-" if num < 0 else ""
+    magnitude = abs(num)
+    with decimal.localcontext() as ctx:
+        # Exact arithmetic: enough precision for any int this process holds
+        ctx.prec = decimal.MAX_PREC
+        ctx.Emax = decimal.MAX_EMAX
+        ctx.Emin = decimal.MIN_EMIN
+        ctx.traps[decimal.Inexact] = True
+        value = _to_decimal(magnitude, magnitude.bit_length())
+        return sign + format(value, "f")
+
+
+def to_digits(num):
+    """
+    Return the decimal digits of abs(num), most significant first.
+    
+    Args:
+        num (int): The integer to split into digits
+    
+    Returns:
+        bytes: One byte per digit, with values 0-9
+    """
+    return to_decimal_string(abs(num)).encode("ascii").translate(_DIGIT_VALUES)
+
+
+def digit_histogram(num):
+    """
+    Count how often each decimal digit occurs in abs(num).
+    
+    Args:
+        num (int): The integer to inspect
+    
+    Returns:
+        list: counts[d] is the number of times digit d occurs
+    """
+    digits = to_digits(num)
+    return [digits.count(d) for d in range(10)]
+
+
+# Demonstration
+if __name__ == "__main__":
+    import time
+    
+    print("=" * 70)
+    print("BIG-INTEGER DIGIT ENGINE")
+    print("=" * 70 + "\n")
+    
+    print(f"to_digits(-9075): {list(to_digits(-9075))}")
+    print(f"digit_histogram(1634): {digit_histogram(1634)}")
+    
+    for digits in [10000, 100000, 1000000]:
+        big = 7 ** int(digits / 0.845098)
+        start_time = time.perf_counter()
+        text = to_decimal_string(big)
+        elapsed = time.perf_counter() - start_time
+        print(f"{len(text)}-digit integer converted in {elapsed:.3f}s")
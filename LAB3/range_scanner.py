@@ -0,0 +1,144 @@
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+
+from bitpack import pack_bits
+
+
+def _scan_chunk(predicate, shm_name, start, lo, hi):
+    """
+    Evaluate predicate over [lo, hi) and store hits in the shared bitset.
+    
+    Runs in a worker process. Chunks start on a multiple of 8 offsets from
+    start, so each worker owns whole bytes of the bitset and no locking is
+    needed.
+    
+    Args:
+        predicate (callable): Picklable function taking an int
+        shm_name (str): Name of the shared memory block holding the bitset
+        start (int): Start of the whole scan (bit 0 of the bitset)
+        lo (int): First number of this chunk (inclusive)
+        hi (int): End of this chunk (exclusive)
+    
+    Returns:
+        tuple: (lo, hi, number of hits)
+    """
+    flags = bytearray(1 if predicate(num) else 0 for num in range(lo, hi))
+    hits = flags.count(1)
+    packed = pack_bits(flags)
+    
+    shm = SharedMemory(name=shm_name)
+    try:
+        offset = (lo - start) // 8
+        shm.buf[offset:offset + len(packed)] = packed
+    finally:
+        shm.close()
+    
+    return lo, hi, hits
+
+
+def _chunk_hits(bitset, start, lo, hi):
+    """Yield the numbers in [lo, hi) whose bit is set in bitset."""
+    offset = lo - start
+    for byte_index in range(offset // 8, (hi - start + 7) // 8):
+        byte = bitset[byte_index]
+        if byte:
+            for bit in range(8):
+                if byte & (0x80 >> bit):
+                    num = start + byte_index * 8 + bit
+                    if num < hi:
+                        yield num
+
+
+def scan_range(predicate, start, stop, chunk_size=None, max_workers=None, ordered=True):
+    """
+    Find every number in [start, stop) for which predicate is true, using
+    all CPU cores.
+    
+    The range is split into chunks that run on a ProcessPoolExecutor. Each
+    worker writes its hits into a shared-memory bitset (one bit per number)
+    and returns only a small summary, so no result lists are pickled back.
+    
+    Args:
+        predicate (callable): Picklable (module-level) function taking an int
+        start (int): First number to test (inclusive)
+        stop (int): End of the range (exclusive)
+        chunk_size (int, optional): Numbers per work unit, rounded up to a
+                                    multiple of 8
+        max_workers (int, optional): Worker processes (default: CPU count)
+        ordered (bool): Yield hits in ascending order; otherwise each chunk
+                        is yielded as soon as it finishes
+    
+    Yields:
+        int: Numbers for which predicate returned a true value
+    
+    Examples:
+        >>> list(scan_range(_is_prime, 0, 30))
+        [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+    """
+    if stop <= start:
+        return
+    
+    total = stop - start
+    max_workers = max_workers or os.cpu_count() or 1
+    if chunk_size is None:
+        # A few chunks per worker keeps cores busy when chunk costs differ
+        chunk_size = math.ceil(total / (max_workers * 4))
+    chunk_size = max(8, -(-chunk_size // 8) * 8)
+    
+    shm = SharedMemory(create=True, size=(total + 7) // 8)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        pending = {
+            executor.submit(_scan_chunk, predicate, shm.name, start, lo, min(lo + chunk_size, stop))
+            for lo in range(start, stop, chunk_size)
+        }
+        
+        # Chunks that finished ahead of the next chunk to yield
+        finished = {}
+        next_lo = start
+        
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                lo, hi, hits = future.result()
+                if not ordered:
+                    if hits:
+                        yield from _chunk_hits(shm.buf, start, lo, hi)
+                else:
+                    finished[lo] = (hi, hits)
+            
+            while next_lo in finished:
+                hi, hits = finished.pop(next_lo)
+                if hits:
+                    yield from _chunk_hits(shm.buf, start, next_lo, hi)
+                next_lo = hi
+    finally:
+        # Drop queued chunks if the caller stopped early, then free the block
+        executor.shutdown(cancel_futures=True)
+        shm.close()
+        shm.unlink()
+
+
+def _is_prime(num):
+    """Trial-division primality check used by the demonstration below."""
+    if num < 2:
+        return False
+    return all(num % i for i in range(2, math.isqrt(num) + 1))
+
+
+# Demonstration
+if __name__ == "__main__":
+    import time
+    
+    print("=" * 70)
+    print("PARALLEL RANGE SCANNER")
+    print("=" * 70 + "\n")
+    
+    print(f"Primes below 100: {list(scan_range(_is_prime, 0, 100))}")
+    
+    start_time = time.perf_counter()
+    count = sum(1 for _ in scan_range(_is_prime, 0, 500000))
+    elapsed = time.perf_counter() - start_time
+    print(f"Primes below 500,000: {count} ({elapsed:.2f}s on {os.cpu_count()} cores)")